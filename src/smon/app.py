@@ -3,31 +3,199 @@
 import asyncio
 import contextlib
 import datetime
+import functools
+import operator
 import os
 import re
+import shlex
 import shutil
 import subprocess
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, List, Optional, Set, Tuple, cast
 
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
+from textual.timer import Timer
 from textual.widgets import DataTable, Footer, Header, Input, Select, Static, TabbedContent, TabPane
 
 from .gpustat_client import GpustatClient
-from .modals import NodeJobsModal
+from .modals import CancelConfirmModal, NodeJobsModal
 from .slurm_client import SlurmClient
 from .styles import APP_CSS
+from .utils import now_hms
 from .widgets import Filter, GpustatViewer, LogViewer, StatusBar, SyntaxViewer
 
 # Sorting constants
 _MEM_UNITS = {"K": 1, "M": 1024, "G": 1024**2, "T": 1024**3}
-_MEM_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)\s*([KMGT])?", re.IGNORECASE)
 _INT_COLUMNS = frozenset({"GPUs", "CPUS", "Nodes"})
 _MEM_COLUMNS = frozenset({"MEM"})
 
 
+@functools.lru_cache(maxsize=4096)
+def _int_sort_key(text: str) -> tuple:
+    try:
+        return (0, int(text))
+    except ValueError:
+        return (1, text.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def _mem_sort_key(text: str) -> tuple:
+    # Split off a single trailing unit by index; cheaper than a regex match per cell
+    unit = text[-1:].upper()
+    if unit in _MEM_UNITS:
+        num_str = text[:-1].rstrip()
+    else:
+        # Slurm reports memory without a unit in megabytes
+        num_str, unit = text, "M"
+    try:
+        return (0, int(float(num_str) * _MEM_UNITS[unit]))
+    except (ValueError, OverflowError):
+        return (1, text.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_sort_key(text: str) -> tuple:
+    return (0, text.lower())
+
+
+# GPU bar glyphs, sliced per node instead of rebuilt by repetition
+_GPU_BAR_USED = "█" * 64
+_GPU_BAR_AVAIL = "░" * 64
+
+
+@functools.lru_cache(maxsize=256)
+def _gpu_bar(used: int, total: int) -> Text:
+    """Render a GPU usage bar, shared by every node with the same counts."""
+    avail = total - used
+    text = Text()
+    if used > 0:
+        text.append(_GPU_BAR_USED[:used], style="dark_orange")
+    if avail > 0:
+        text.append(_GPU_BAR_AVAIL[:avail], style="grey50")
+    text.append(f" {used}/{total}", style="cyan")
+    return text
+
+
+# Parser per column, resolved once per sort rather than for every value
+_SORT_KEY_PARSERS: Dict[str, Callable[[str], tuple]] = {
+    **{col: _int_sort_key for col in _INT_COLUMNS},
+    **{col: _mem_sort_key for col in _MEM_COLUMNS},
+}
+
+# Table column schemas
+_JOB_COLUMNS_TRES = (
+    "JOBID",
+    "USERNAME",
+    "STATE",
+    "PARTITION",
+    "CPUS",
+    "MEM",
+    "GPUs",
+    "TimeUsed",
+    "TimeLimit",
+    "NAME",
+    "ReqNodes",
+    "Nodes",
+    "NodeList",
+)
+_JOB_COLUMNS_BASIC = (
+    "JOBID",
+    "USER",
+    "STATE",
+    "PARTITION",
+    "CPUS",
+    "MEM",
+    "TIME",
+    "NAME",
+    "Nodes",
+    "NODELIST(REASON)",
+)
+
+# Flags sinfo/squeue append to states, e.g. "idle*" (not responding) or "mix-" (planned)
+_STATE_SUFFIXES = "*+~#!%$@^-"
+
+# Adaptive polling: back off while the cluster is idle
+_MAX_REFRESH_INTERVAL = 60.0
+_REFRESH_BACKOFF = 1.5
+# Shortest pause between the end of one jobs poll and the start of the next
+_MIN_REFRESH_GAP = 1.0
+# Job states (long and squeue short forms) whose output and state can still change
+_ACTIVE_JOB_STATES = frozenset({"RUNNING", "PENDING", "CONFIGURING", "COMPLETING", "R", "PD", "CF", "CG"})
+# Node states change on a scale of minutes, so sinfo is polled less often than squeue
+_NODE_REFRESH_INTERVAL = 30.0
+
+# Job detail/script cache (finished jobs are cached until evicted)
+_DETAIL_CACHE_TTL = 10.0
+_DETAIL_CACHE_SIZE = 256
+
+# Read size when streaming output files into the pager
+_PAGER_CHUNK_SIZE = 64 * 1024
+
+# Delay before applying a filter change, so a burst of changes triggers one refresh.
+# Shorter feels snappier but lets typing bursts through as separate squeue calls;
+# longer coalesces more but makes the filter feel laggy.
+_FILTER_DEBOUNCE = 0.25
+
+# gpustat-web frames are rendered at most this often; intermediate frames are dropped
+_GPUSTAT_FLUSH_INTERVAL = 0.1
+
+# Rows added per batch before yielding to the event loop (progressive rendering)
+_PROGRESSIVE_RENDER_SIZE = 500
+
+# Actions on the selected job; only offered while the Jobs tab is shown
+_JOB_ACTIONS = frozenset({"show_output", "toggle_realtime", "cancel_job", "copy_jobid"})
+
+# Fixed status/header fragments, indexed by the current real-time or sort-reverse flag
+_REALTIME_HINTS = (" | Press 't' to enable real-time", " | 🔄 Real-time ON")
+_SORT_ARROWS = ("▲", "▼")
+
+# Job dict fields read for each row; get_jobs fills every column of its squeue format
+_TRES_JOB_FIELDS = operator.itemgetter(
+    "JOBID",
+    "USERNAME",
+    "STATE",
+    "PARTITION",
+    "TRES",
+    "GPU_COUNT",
+    "TimeUsed",
+    "TimeLimit",
+    "NAME_SHORT",
+    "ReqNodes",
+    "NodeList",
+    "Reason",
+)
+_BASIC_JOB_FIELDS = operator.itemgetter(
+    "JOBID", "USER", "STATE", "PARTITION", "CPUS", "MEM", "TIME", "NAME_SHORT", "NODELIST(REASON)"
+)
+
+_NODE_COLUMNS = ("NODE", "STATE", "AVAIL", "GPUs", "CPUS", "MEM", "PARTITION")
+
+
+def _cell_changed(old: Any, new: Any) -> bool:
+    """Check whether a table cell needs to be redrawn.
+
+    Rich ``Text`` equality ignores the base style, so compare it explicitly.
+    """
+    if old is new:
+        # Memoized cells (state, time used) are shared between refreshes
+        return False
+    if old != new:
+        return True
+    return isinstance(new, Text) and isinstance(old, Text) and old.style != new.style
+
+
+def _unique_row_key(rows: Dict[str, tuple], jobid: str) -> str:
+    """Row key for a job id already in ``rows``, so a repeated id adds a row instead of replacing one."""
+    n = 2
+    while f"{jobid}#{n}" in rows:
+        n += 1
+    return f"{jobid}#{n}"
+
+
 class SlurmDashboard(App):
     """Slurm Dashboard application for monitoring jobs and nodes."""
 
@@ -94,12 +262,39 @@ class SlurmDashboard(App):
         self.output_refresh_enabled = False
         self.user_wants_realtime = True
         self.last_refresh_time: Optional[datetime.datetime] = None
-        self._pending_cancel_jobid: Optional[str] = None
+        self._refresh_timer: Optional[Timer] = None
+        self._filter_timer: Optional[Timer] = None
+        self._dynamic_interval = refresh_sec
+        self._last_activity_signature: Optional[int] = None
+        # Latest job states from the lightweight state poll
+        self._state_cache: Dict[str, str] = {}
+        # jobid -> (detail, script, fetched_at)
+        self._detail_cache: Dict[str, Tuple[str, str, float]] = {}
+        # (stdout, stderr) paths and byte offsets already shown for the current job
+        self._output_paths: Optional[Tuple[str, str]] = None
+        self._tail_offsets: Optional[Tuple[int, int]] = None
         self._sort_column: Optional[str] = None
         self._sort_reverse: bool = False
+        # Rendered rows currently shown in each table, keyed by row key
+        self._jobs_cache: Dict[str, tuple] = {}
+        self._jobs_schema: Optional[tuple] = None
+        self._nodes_cache: Dict[str, tuple] = {}
+        self._nodes_schema: Optional[tuple] = None
+        self._nodes_refreshed_at = 0.0
+        # Unfiltered results of the last squeue/sinfo calls; filters are applied locally
+        self._raw_jobs: Optional[List[Dict[str, Any]]] = None
+        self._raw_nodes: Optional[List[Dict[str, Any]]] = None
+        # Row formatting runs here so large refreshes don't block the event loop
+        self._compute_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="smon-format")
+        # Held while a refresh is in flight; timers skip a tick instead of cancelling it
+        self._jobs_lock = asyncio.Lock()
+        self._nodes_lock = asyncio.Lock()
+        self._output_lock = asyncio.Lock()
         # gpustat-web integration
         self.gpustat_web_url = gpustat_web_url
         self._gpustat_client: Optional[GpustatClient] = None
+        self._latest_gpustat_content: Optional[str] = None
+        self._gpustat_flush_scheduled = False
 
     # State filter options
     STATE_OPTIONS = [
@@ -163,37 +358,39 @@ class SlurmDashboard(App):
                             yield GpustatViewer(id="gpustat_viewer")
         yield Footer()
 
-    async def on_key(self, event) -> None:
-        """Handle key events for cancel confirmation."""
-        if self._pending_cancel_jobid is not None:
-            if event.key != "c":
-                # Abort cancellation on any key except 'c'
-                # Note: 'c' key is handled in action_cancel_job to avoid race condition
-                self._pending_cancel_jobid = None
-                self.status.message = "Cancellation aborted"
-            event.stop()
-            event.prevent_default()
-
     async def on_mount(self) -> None:
-        jobs_table: DataTable = self.query_one("#jobs_table", DataTable)
-        jobs_table.cursor_type = "row"
-        jobs_table.zebra_stripes = True
-        jobs_table.focus()
-
-        nodes_table: DataTable = self.query_one("#nodes_table", DataTable)
-        nodes_table.cursor_type = "row"
-        nodes_table.zebra_stripes = True
+        # Resolve frequently updated widgets once instead of querying the DOM on every refresh
+        self._jobs_table = self.query_one("#jobs_table", DataTable)
+        self._nodes_table = self.query_one("#nodes_table", DataTable)
+        self._job_detail = self.query_one("#job_detail", Static)
+        self._script_viewer = self.query_one("#script_viewer", SyntaxViewer)
+        self._stdout_viewer = self.query_one("#stdout_viewer", LogViewer)
+        self._stderr_viewer = self.query_one("#stderr_viewer", LogViewer)
+        self._gpustat_viewer = self.query_one("#gpustat_viewer", GpustatViewer)
+        self._tabs = self.query_one(TabbedContent)
+        self._job_search = self.query_one("#job_search", Input)
+        self._node_search = self.query_one("#node_search", Input)
+
+        self._jobs_table.cursor_type = "row"
+        self._jobs_table.zebra_stripes = True
+        self._jobs_table.focus()
+
+        self._nodes_table.cursor_type = "row"
+        self._nodes_table.zebra_stripes = True
 
         await self.refresh_data()
-        self._refresh_timer = self.set_interval(self.refresh_sec, self._schedule_refresh)
+        self.set_interval(_NODE_REFRESH_INTERVAL, self._schedule_nodes_refresh)
         self.set_interval(5.0, self._schedule_output_refresh)  # Output refresh every 5s
 
         # Start gpustat-web connection if configured
         await self._start_gpustat_connection()
 
+    def on_unmount(self) -> None:
+        self._compute_pool.shutdown(wait=False, cancel_futures=True)
+
     async def _start_gpustat_connection(self) -> None:
         """Start gpustat-web WebSocket connection."""
-        gpustat_viewer = self.query_one("#gpustat_viewer", GpustatViewer)
+        gpustat_viewer = self._gpustat_viewer
 
         if not self.gpustat_web_url:
             gpustat_viewer.set_disconnected()
@@ -207,8 +404,11 @@ class SlurmDashboard(App):
 
         def on_gpustat_message(content: str) -> None:
             """Handle gpustat-web message - schedule UI update."""
-            # Use call_later to safely update UI from async context
-            self.call_later(gpustat_viewer.set_content, content)
+            # Keep only the latest frame and render at most once per flush interval
+            self._latest_gpustat_content = content
+            if not self._gpustat_flush_scheduled:
+                self._gpustat_flush_scheduled = True
+                self.set_timer(_GPUSTAT_FLUSH_INTERVAL, self._flush_gpustat)
 
         # Run WebSocket connection in background worker
         self.run_worker(
@@ -218,18 +418,63 @@ class SlurmDashboard(App):
             exit_on_error=False,
         )
 
+    def _flush_gpustat(self) -> None:
+        """Render the latest gpustat-web frame."""
+        self._gpustat_flush_scheduled = False
+        if self._latest_gpustat_content is not None:
+            self._gpustat_viewer.set_content(self._latest_gpustat_content)
+            self._latest_gpustat_content = None
+
     def _schedule_refresh(self) -> None:
-        self.run_worker(self.refresh_data(), group="refresh", exclusive=True, exit_on_error=False)
+        if self._jobs_lock.locked():
+            # Retry next interval: a filter re-sync holding the lock does not re-arm the timer,
+            # and a poll in flight replaces this timer when it finishes
+            self._arm_refresh_timer()
+            return
+        self.run_worker(
+            self.refresh_data(quiet=True, nodes=False), group="refresh_jobs", exclusive=True, exit_on_error=False
+        )
+
+    def _schedule_nodes_refresh(self) -> None:
+        # Nobody sees the nodes table from another tab; it is refreshed when the tab is shown
+        if self._nodes_lock.locked() or self._tabs.active != "tab_nodes":
+            return
+        self.run_worker(
+            self.refresh_data(quiet=True, jobs=False), group="refresh_nodes", exclusive=True, exit_on_error=False
+        )
 
     def _update_refresh_timer(self) -> None:
         """Update refresh timer with new interval."""
-        if hasattr(self, "_refresh_timer") and self._refresh_timer:
+        self._dynamic_interval = self.refresh_sec
+        self._arm_refresh_timer()
+
+    def _arm_refresh_timer(self, elapsed: float = 0.0) -> None:
+        """(Re)start the one-shot timer for the next automatic refresh.
+
+        Args:
+            elapsed: Time the poll that just finished took, so polls start one interval apart.
+        """
+        if self._refresh_timer:
             self._refresh_timer.stop()
-        self._refresh_timer = self.set_interval(self.refresh_sec, self._schedule_refresh)
+        delay = max(self._dynamic_interval - elapsed, _MIN_REFRESH_GAP)
+        self._refresh_timer = self.set_timer(delay, self._schedule_refresh)
+
+    def _update_dynamic_interval(self, jobs: List[Dict[str, Any]]) -> None:
+        """Back off the refresh interval while job states stay the same."""
+        signature = hash(tuple((j.get("JOBID", ""), j.get("STATE", "")) for j in jobs))
+        if signature == self._last_activity_signature:
+            backoff = min(self._dynamic_interval * _REFRESH_BACKOFF, _MAX_REFRESH_INTERVAL)
+            self._dynamic_interval = max(self.refresh_sec, backoff)
+        else:
+            self._dynamic_interval = self.refresh_sec
+        self._last_activity_signature = signature
 
     def _schedule_output_refresh(self) -> None:
         """Schedule output refresh for the currently selected job."""
         if self.output_refresh_enabled and self.current_jobid:
+            # Stop polling output once the job has finished
+            if self._job_state(self.current_jobid) not in _ACTIVE_JOB_STATES or self._output_lock.locked():
+                return
             self.run_worker(
                 self._refresh_current_output(),
                 group="output_refresh",
@@ -237,31 +482,83 @@ class SlurmDashboard(App):
                 exit_on_error=False,
             )
 
+    def _job_state(self, jobid: str) -> Optional[str]:
+        """Most recent known state of a job, preferring the state poll."""
+        state = self._state_cache.get(jobid)
+        if state is None:
+            row = self._jobs_cache.get(jobid)
+            state = row[2].plain if row is not None else None
+        return state
+
+    async def _refresh_job_states(self) -> None:
+        """Poll the states of all active jobs in the table with one squeue call."""
+        # Job ids from the JOBID cells: a repeated id has a "#n" row key, which squeue -j would reject
+        active = list(dict.fromkeys(row[0] for row in self._jobs_cache.values() if row[2].plain in _ACTIVE_JOB_STATES))
+        states = await self.client.get_job_states(active)
+        if states is None:
+            # squeue failed; keep the last known states rather than marking every job finished
+            return
+        # Jobs squeue stopped reporting have left the queue
+        self._state_cache = {jobid: states.get(jobid, "COMPLETED") for jobid in active}
+        # Something changed: poll the full tables at the base rate again.
+        # Rows are read again since a table refresh may have dropped some while squeue ran.
+        if self._dynamic_interval > self.refresh_sec and any(
+            row[0] in self._state_cache and self._state_cache[row[0]] != row[2].plain
+            for row in self._jobs_cache.values()
+        ):
+            self._update_refresh_timer()
+
     async def _refresh_current_output(self) -> None:
         """Refresh output for the currently selected job."""
-        if not self.current_jobid:
+        jobid = self.current_jobid
+        if not jobid:
             return
-        try:
-            stdout, stderr = await self.client.get_job_output(self.current_jobid)
-            self.query_one("#stdout_viewer", LogViewer).set_content(stdout or "No stdout available")
-            self.query_one("#stderr_viewer", LogViewer).set_content(stderr or "No stderr available")
-        except Exception:
-            pass
+        async with self._output_lock:
+            try:
+                await self._refresh_job_states()
+                if self._job_state(jobid) not in _ACTIVE_JOB_STATES:
+                    self.output_refresh_enabled = False
+                # Only read what was written since the last refresh
+                previous = self._tail_offsets
+                if self._output_paths is not None:
+                    stdout, stderr, offsets = await self.client.tail_output_files(self._output_paths, previous)
+                else:
+                    stdout, stderr, offsets = await self.client.get_job_output_tail(jobid, previous)
+                if self.current_jobid != jobid:
+                    return
+                self._tail_offsets = offsets
+                previous_stdout, previous_stderr = previous if previous is not None else (None, None)
+                self._show_output(self._stdout_viewer, stdout, previous_stdout, offsets[0], "No stdout available")
+                self._show_output(self._stderr_viewer, stderr, previous_stderr, offsets[1], "No stderr available")
+            except Exception:
+                pass
+
+    @staticmethod
+    def _show_output(viewer: LogViewer, text: str, previous: Optional[int], offset: int, placeholder: str) -> None:
+        """Append newly read output to a viewer, or replace its content when reading started over."""
+        if previous is None or offset < previous:
+            viewer.set_content(text or placeholder)
+        elif text:
+            if previous == 0:
+                # Replace the placeholder or read error shown so far
+                viewer.set_content(text)
+            else:
+                viewer.append_content(text)
 
     async def action_refresh(self) -> None:
+        self._dynamic_interval = self.refresh_sec
         await self.refresh_data()
 
     def action_focus_search(self) -> None:
         """Focus the search input in the current tab."""
         try:
-            tabbed_content = self.query_one("TabbedContent")
-            active_tab = getattr(tabbed_content, "active", None)
+            active_tab = self._tabs.active
 
             if active_tab == "tab_jobs":
-                self.query_one("#job_search", Input).focus()
+                self._job_search.focus()
                 self.status.message = "Search jobs (press Enter to apply filter)"
             elif active_tab == "tab_nodes":
-                self.query_one("#node_search", Input).focus()
+                self._node_search.focus()
                 self.status.message = "Search nodes (press Enter to apply filter)"
             else:
                 self.status.message = "Search not available in this tab"
@@ -270,7 +567,7 @@ class SlurmDashboard(App):
 
     async def action_show_output(self) -> None:
         """Open output files in external pager (bat/less)."""
-        table: DataTable = self.query_one("#jobs_table", DataTable)
+        table = self._jobs_table
         if not table.row_count or table.cursor_coordinate is None:
             self.status.message = "No job selected"
             return
@@ -279,7 +576,8 @@ class SlurmDashboard(App):
             return
         jobid = str(row[0])
 
-        stdout_path, stderr_path = await self.client.get_job_output_paths(jobid)
+        cached = self._detail_cache.get(jobid)
+        stdout_path, stderr_path = await self.client.get_job_output_paths(jobid, cached[0] if cached else None)
         if not stdout_path and not stderr_path:
             self.status.message = "No output files available"
             return
@@ -292,28 +590,57 @@ class SlurmDashboard(App):
             self.status.message = "Output files not found on disk"
             return
 
-        # Build shell command to:
-        # 1) Remove ^M (carriage return) from tqdm progress bars
-        # 2) Support ANSI colors
-        # 3) Start at end of file
-        files_str = " ".join(f'"{f}"' for f in files)
+        # Pager arguments: ANSI colors and start at the end of the file
         if "bat" in pager:
-            # bat with less pager, strip \r
-            shell_cmd = (
-                f"cat {files_str} | sed 's/\\r//g' | {pager} --paging=always --style=plain --pager='less -R +G'"
-            )
+            argv = [pager, "--paging=always", "--style=plain", "--pager=less -R +G"]
         else:
-            # less: -R for ANSI colors, +G to start at end
-            shell_cmd = f"cat {files_str} | sed 's/\\r//g' | {pager} -R +G"
+            argv = shlex.split(pager)
+            if os.path.basename(argv[0]) == "less":
+                argv += ["-R", "+G"]
 
-        self.status.message = f"Opening output with {os.path.basename(pager)}..."
+        self.status.message = f"Opening output with {os.path.basename(argv[0])}..."
 
         with self.suspend():
-            subprocess.run(shell_cmd, shell=True)
+            error = self._page_files(argv, files)
 
-        self.status.message = f"Returned from viewing job {jobid} output"
+        if error:
+            self.status.message = f"Failed to open output: {error}"
+        else:
+            self.status.message = f"Returned from viewing job {jobid} output"
+
+    @staticmethod
+    def _page_files(argv: List[str], files: List[str]) -> Optional[str]:
+        """Stream files into a pager, removing ^M (carriage returns) from tqdm progress bars.
 
-    def _find_pager(self) -> str:
+        Returns:
+            An error message if the pager could not be started or a file could not be read.
+        """
+        try:
+            proc = subprocess.Popen(argv, stdin=subprocess.PIPE)
+        except OSError as e:
+            return f"{argv[0]}: {e.strerror or e}"
+        stdin = cast(IO[bytes], proc.stdin)
+        error = None
+        try:
+            for path in files:
+                with open(path, "rb") as f:
+                    while chunk := f.read(_PAGER_CHUNK_SIZE):
+                        stdin.write(chunk.replace(b"\r", b""))
+        except BrokenPipeError:
+            # The pager was closed before reading everything
+            pass
+        except OSError as e:
+            error = f"{e.filename or argv[0]}: {e.strerror or e}"
+        finally:
+            with contextlib.suppress(OSError):
+                stdin.close()
+            proc.wait()
+        return error
+
+    # PATH is not expected to change while the app runs
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _find_pager() -> str:
         """Find the best available pager."""
         # Try bat first (modern, with syntax highlighting)
         if shutil.which("bat"):
@@ -339,8 +666,7 @@ class SlurmDashboard(App):
     def action_goto_jobs(self) -> None:
         """Switch to Jobs tab."""
         try:
-            tabbed_content = self.query_one("TabbedContent", TabbedContent)
-            tabbed_content.active = "tab_jobs"
+            self._tabs.active = "tab_jobs"
             self.status.message = "Switched to Jobs tab"
         except Exception:
             pass
@@ -348,27 +674,14 @@ class SlurmDashboard(App):
     def action_goto_nodes(self) -> None:
         """Switch to Nodes tab."""
         try:
-            tabbed_content = self.query_one("TabbedContent", TabbedContent)
-            tabbed_content.active = "tab_nodes"
+            self._tabs.active = "tab_nodes"
             self.status.message = "Switched to Nodes tab"
         except Exception:
             pass
 
     async def action_cancel_job(self) -> None:
         """Cancel the selected job."""
-        # If already in confirmation mode, execute the cancellation
-        if self._pending_cancel_jobid is not None:
-            jobid = self._pending_cancel_jobid
-            self._pending_cancel_jobid = None
-            success, msg = await self.client.cancel_job(jobid)
-            if success:
-                self.status.message = f"✅ {msg}"
-                await self.refresh_data()
-            else:
-                self.status.message = f"❌ Failed to cancel job {jobid}: {msg}"
-            return
-
-        table: DataTable = self.query_one("#jobs_table", DataTable)
+        table = self._jobs_table
         if not table.row_count or table.cursor_coordinate is None:
             self.status.message = "No job selected"
             return
@@ -380,27 +693,38 @@ class SlurmDashboard(App):
             self.status.message = "Could not get job ID"
             return
 
-        # Confirm cancellation
-        self.status.message = f"⚠️ Cancel job {jobid}? Press 'c' again to confirm, any other key to abort"
-        self._pending_cancel_jobid = str(jobid)
+        # Confirm cancellation; the modal takes the next key press
+        jobid = str(jobid)
+        self.push_screen(CancelConfirmModal(jobid), functools.partial(self._confirm_cancel, jobid))
+
+    async def _confirm_cancel(self, jobid: str, confirmed: Optional[bool]) -> None:
+        """Cancel the job once the confirmation modal was answered with 'c'."""
+        if not confirmed:
+            self.status.message = "Cancellation aborted"
+            return
+        success, msg = await self.client.cancel_job(jobid)
+        if success:
+            self.status.message = f"✅ {msg}"
+            await self.refresh_data()
+        else:
+            self.status.message = f"❌ Failed to cancel job {jobid}: {msg}"
 
     def action_copy_jobid(self) -> None:
         """Copy selected job ID to clipboard."""
-        table: DataTable = self.query_one("#jobs_table", DataTable)
-        if not table.row_count or table.cursor_coordinate is None:
+        table = self._jobs_table
+        if not table.row_count or not table.is_valid_coordinate(table.cursor_coordinate):
             self.status.message = "No job selected"
             return
 
-        row_idx = table.cursor_coordinate.row
-        row_data = table.get_row_at(row_idx)
-        jobid = row_data[0] if row_data else None
+        # Rows are keyed by JOBID (with a "#n" suffix on repeats), so no row data needs to be copied out
+        row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+        jobid = row_key.partition("#")[0] if row_key else row_key
         if not jobid:
             self.status.message = "Could not get job ID"
             return
 
-        jobid_str = str(jobid)
         # Use Textual's built-in clipboard support (uses OSC 52 escape sequence)
-        self.copy_to_clipboard(jobid_str)
+        self.copy_to_clipboard(jobid)
         self.status.message = f"📋 Copied job ID: {jobid}"
 
     def action_increase_refresh(self) -> None:
@@ -422,39 +746,109 @@ class SlurmDashboard(App):
         self.status.message = f"Theme: {theme_name}"
         # Update syntax viewer theme
         try:
-            self.query_one("#script_viewer", SyntaxViewer)._render_code()
+            self._script_viewer._render_code()
         except Exception:
             pass
 
-    async def refresh_data(self) -> None:
-        """Refresh jobs and nodes data."""
-        self.status.message = "Refreshing…"
+    async def refresh_data(
+        self, quiet: bool = False, jobs: bool = True, nodes: bool = True, fetch: bool = True
+    ) -> None:
+        """Refresh jobs and nodes data.
+
+        Args:
+            quiet: Skip the interim "Refreshing…" message so timed polls update the status bar only once.
+            jobs: Refresh the jobs table.
+            nodes: Refresh the nodes table.
+            fetch: Query Slurm; otherwise re-filter the last results (used when only the filter changed).
+        """
+        started = time.monotonic()
+        if nodes and fetch and self._tabs.active != "tab_nodes":
+            # Nobody sees the nodes table; sinfo runs when the Nodes tab is shown instead
+            nodes = False
+            self._nodes_refreshed_at = 0.0
+        if not quiet:
+            self.status.message = "Refreshing…"
         try:
-            jobs, nodes = await asyncio.gather(self.client.get_jobs(), self.client.get_nodes())
-            jobs_f = self.filter.apply_jobs(jobs)
-            nodes_f = self.filter.apply_nodes(nodes)
-            self._populate_jobs(jobs_f)
-            self._populate_nodes(nodes_f)
-            # Re-apply sorting if active
-            if self._sort_column:
-                self._apply_current_sort()
+            tasks = []
+            if jobs:
+                tasks.append(self._refresh_jobs(fetch))
+            if nodes:
+                tasks.append(self._refresh_nodes(fetch))
+            await asyncio.gather(*tasks)
             self.last_refresh_time = datetime.datetime.now()
-            refresh_time = self.last_refresh_time.strftime("%H:%M:%S")
-            self.status.message = f"Updated @ {refresh_time} | Jobs: {len(jobs_f)} | Nodes: {len(nodes_f)} | Interval: {self.refresh_sec:.0f}s"
+            refresh_time = now_hms()
+            if self._raw_nodes is None:
+                # sinfo has not run yet (the Nodes tab was never shown)
+                nodes_status = ""
+            elif self._tabs.active != "tab_nodes":
+                # Nodes are only polled while their tab is shown
+                nodes_status = f" | Nodes: {len(self._nodes_cache)} (stale)"
+            else:
+                nodes_status = f" | Nodes: {len(self._nodes_cache)}"
+            self.status.message = (
+                f"Updated @ {refresh_time} | Jobs: {len(self._jobs_cache)}{nodes_status}"
+                f" | Interval: {self._dynamic_interval:.0f}s"
+            )
         except Exception as e:
             self.status.message = f"Error: {e}"
-
-    def _format_state(self, state: str, is_node: bool = False) -> Text:
+        finally:
+            if jobs and fetch:
+                self._arm_refresh_timer(time.monotonic() - started)
+
+    async def _refresh_jobs(self, fetch: bool = True) -> None:
+        """Fetch jobs and sync the jobs table."""
+        async with self._jobs_lock:
+            fetched = fetch or self._raw_jobs is None
+            if fetched:
+                jobs = await self.client.get_jobs()
+                self._update_dynamic_interval(jobs)
+                # Identical squeue output leaves the table as it is; skip formatting and diffing
+                if jobs == self._raw_jobs:
+                    self._state_cache.clear()
+                    return
+                self._raw_jobs = jobs
+            jobs_f = self.filter.apply_jobs(self._raw_jobs)
+            loop = asyncio.get_running_loop()
+            job_columns, job_rows = await loop.run_in_executor(self._compute_pool, self._build_job_rows, jobs_f)
+            await self._apply_job_rows(job_columns, job_rows)
+            if fetched:
+                self._state_cache.clear()
+
+    async def _refresh_nodes(self, fetch: bool = True) -> None:
+        """Fetch nodes and sync the nodes table."""
+        async with self._nodes_lock:
+            if not fetch and self._raw_nodes is None:
+                # Never fetched: nothing to re-filter until the Nodes tab is shown
+                return
+            if fetch:
+                nodes = await self.client.get_nodes()
+                if nodes == self._raw_nodes:
+                    self._nodes_refreshed_at = time.monotonic()
+                    return
+                self._raw_nodes = nodes
+            nodes_f = self.filter.apply_nodes(self._raw_nodes)
+            loop = asyncio.get_running_loop()
+            node_rows = await loop.run_in_executor(self._compute_pool, self._build_node_rows, nodes_f)
+            await self._apply_node_rows(node_rows)
+            if fetch:
+                self._nodes_refreshed_at = time.monotonic()
+
+    # States come from a small fixed vocabulary, so the rendered Text is shared between rows
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_state(state: str, is_node: bool = False) -> Text:
         """Format state with color."""
-        colors = self.NODE_STATE_COLORS if is_node else self.JOB_STATE_COLORS
+        colors = SlurmDashboard.NODE_STATE_COLORS if is_node else SlurmDashboard.JOB_STATE_COLORS
         # Handle states like "idle*" or "RUNNING+"
-        base_state = state.rstrip("*+~#")
+        base_state = state.rstrip(_STATE_SUFFIXES)
         color = colors.get(base_state, "white")
         return Text(state, style=color)
 
-    def _format_time_with_ratio(self, time_used: str, time_limit: str) -> Text:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_time_with_ratio(time_used: str, time_limit: str) -> Text:
         """Format time used with color based on ratio to limit."""
-        ratio = self.client.calculate_time_ratio(time_used, time_limit)
+        ratio = SlurmClient.calculate_time_ratio(time_used, time_limit)
         if ratio < 0:
             return Text(time_used)
         elif ratio >= 0.95:
@@ -464,166 +858,249 @@ class SlurmDashboard(App):
         else:
             return Text(time_used, style="green")
 
-    def _get_column_label(self, col: str) -> str:
+    def _get_column_label(self, col: str) -> Text:
         """Get column label with sort indicator if applicable."""
         if self._sort_column == col:
-            arrow = "▼" if self._sort_reverse else "▲"
-            return f"{col} {arrow}"
-        return col
+            return self._label_text(col, _SORT_ARROWS[self._sort_reverse])
+        return self._label_text(col)
+
+    # Header labels are shared, so an unchanged header keeps the very same Text object
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _label_text(col: str, arrow: str = "") -> Text:
+        """Build a column header label."""
+        return Text(f"{col} {arrow}" if arrow else col)
 
     def _apply_current_sort(self) -> None:
         """Apply current sort to jobs table."""
         if not self._sort_column:
             return
         try:
-            table = self.query_one("#jobs_table", DataTable)
-            table.sort(self._sort_column, key=self._sort_key, reverse=self._sort_reverse)
+            table = self._jobs_table
+            table.sort(self._sort_column, key=self._sort_key(self._sort_column), reverse=self._sort_reverse)
         except Exception:
             pass
 
-    def _populate_jobs(self, jobs: List[Dict[str, Any]]) -> None:
+    async def _sync_rows(
+        self,
+        table: DataTable,
+        cache: Dict[str, tuple],
+        columns: tuple,
+        rows: Dict[str, tuple],
+        key_columns: tuple,
+        keep_order: bool = True,
+    ) -> Set[str]:
+        """Apply row additions, removals and cell updates to a keyed table.
+
+        Args:
+            table: Table to update in place.
+            cache: Rendered rows currently in the table, updated in place.
+            columns: Column keys matching the row tuples.
+            rows: New rendered rows keyed by row key, in display order.
+            key_columns: Columns whose (plain string) values identify a row.
+            keep_order: Reorder the table to match ``rows`` if it drifted.
+
+        Returns:
+            Columns with new or updated cells (all columns when a row was added).
+        """
+        changed_columns: Set[str] = set()
+        added = 0
+        for key in [k for k in cache if k not in rows]:
+            table.remove_row(key)
+            del cache[key]
+
+        pending = iter(rows.items())
+        done = False
+        while not done:
+            # Screen updates are held back until a whole batch is applied
+            with self.batch_update():
+                for key, row in pending:
+                    old = cache.get(key)
+                    if old is None:
+                        table.add_row(*row, key=key)
+                        changed_columns.update(columns)
+                        added += 1
+                    elif any(_cell_changed(a, b) for a, b in zip(old, row)):
+                        for col, old_cell, new_cell in zip(columns, old, row):
+                            if _cell_changed(old_cell, new_cell):
+                                table.update_cell(key, col, new_cell)
+                                changed_columns.add(col)
+                    else:
+                        continue
+                    cache[key] = row
+                    if old is None and added % _PROGRESSIVE_RENDER_SIZE == 0:
+                        break
+                else:
+                    done = True
+            if not done:
+                # Let Textual repaint and dispatch input between batches of new rows
+                await asyncio.sleep(0)
+
+        if keep_order and [r.key.value for r in table.ordered_rows] != list(rows):
+            idx = [columns.index(col) for col in key_columns]
+            if len(idx) == 1:
+                position = {row[idx[0]]: pos for pos, row in enumerate(rows.values())}
+            else:
+                position = {tuple(row[i] for i in idx): pos for pos, row in enumerate(rows.values())}
+            table.sort(*key_columns, key=lambda value: position.get(value, len(position)))
+        return changed_columns
+
+    def _reset_table(self, table: DataTable, cache: Dict[str, tuple], columns: tuple) -> None:
+        """Clear a table and rebuild its columns for a new schema."""
+        table.clear(columns=True)
+        cache.clear()
+        for col in columns:
+            table.add_column(self._get_column_label(col), key=col)
+
+    async def _populate_jobs(self, jobs: List[Dict[str, Any]]) -> None:
         """Populate the jobs table with data."""
-        table: DataTable = self.query_one("#jobs_table", DataTable)
+        await self._apply_job_rows(*self._build_job_rows(jobs))
 
-        saved_cursor_row = None
-        if table.cursor_coordinate is not None:
-            saved_cursor_row = table.cursor_coordinate.row
+    def _build_job_rows(self, jobs: List[Dict[str, Any]]) -> Tuple[tuple, Dict[str, tuple]]:
+        """Format job dicts into table rows.
 
-        table.clear(columns=True)
+        Does not touch any widget, so it is safe to run in the compute pool.
 
-        if jobs and "TRES" in jobs[0]:
-            columns = [
-                "JOBID",
-                "USERNAME",
-                "STATE",
-                "PARTITION",
-                "CPUS",
-                "MEM",
-                "GPUs",
-                "TimeUsed",
-                "TimeLimit",
-                "NAME",
-                "ReqNodes",
-                "Nodes",
-                "NodeList",
-            ]
-            # Add columns with sort indicator
-            for col in columns:
-                table.add_column(self._get_column_label(col), key=col)
-            for j in jobs:
-                gpu_display = j.get("GPU_COUNT", "0")
-                cpus = self.client.extract_cpus_from_tres(j.get("TRES", ""))
-                mem = self.client.extract_mem_from_tres(j.get("TRES", ""))
-                node_count = self.client.count_nodes_from_nodelist(j.get("NodeList", ""))
-                nodelist_display = self.client.combine_nodelist_reason(j.get("NodeList", ""), j.get("Reason", ""))
-                state = j.get("STATE", "")
-                time_used = j.get("TimeUsed", j.get("TIME", ""))
-                time_limit = j.get("TimeLimit", "")
-                table.add_row(
-                    j.get("JOBID", ""),
-                    j.get("USERNAME", j.get("USER", "")),
-                    self._format_state(state),
-                    j.get("PARTITION", ""),
-                    cpus,
-                    mem,
-                    gpu_display,
-                    self._format_time_with_ratio(time_used, time_limit),
-                    time_limit,
-                    j.get("NAME", "")[:30],
-                    j.get("ReqNodes", ""),
-                    node_count,
-                    nodelist_display,
-                )
-        else:
-            columns = [
-                "JOBID",
-                "USER",
-                "STATE",
-                "PARTITION",
-                "CPUS",
-                "MEM",
-                "TIME",
-                "NAME",
-                "Nodes",
-                "NODELIST(REASON)",
-            ]
-            for col in columns:
-                table.add_column(self._get_column_label(col), key=col)
-            for j in jobs:
-                state = j.get("STATE", "")
-                node_count = self.client.count_nodes_from_nodelist(j.get("NODELIST(REASON)", ""))
-                table.add_row(
-                    j.get("JOBID", ""),
-                    j.get("USER", ""),
-                    self._format_state(state),
-                    j.get("PARTITION", ""),
-                    j.get("CPUS", ""),
-                    j.get("MEM", ""),
-                    j.get("TIME", ""),
-                    j.get("NAME", ""),
-                    node_count,
-                    j.get("NODELIST(REASON)", ""),
-                )
+        Returns:
+            Tuple of (column schema, rows keyed by JOBID).
+        """
+        # The layout is checked on every call: get_jobs falls back to the basic format when squeue -O fails
+        if not jobs:
+            return self._jobs_schema or _JOB_COLUMNS_BASIC, {}
+        if "TRES" in jobs[0]:
+            return _JOB_COLUMNS_TRES, self._build_tres_job_rows(jobs)
+        return _JOB_COLUMNS_BASIC, self._build_basic_job_rows(jobs)
+
+    def _build_tres_job_rows(self, jobs: List[Dict[str, Any]]) -> Dict[str, tuple]:
+        """Format jobs from the squeue -O (TRES) layout."""
+        rows: Dict[str, tuple] = {}
+        # Bound once so the loop below only does local lookups per row
+        client = self.client
+        format_state = self._format_state
+        format_time = self._format_time_with_ratio
+        extract_cpus = client.extract_cpus_from_tres
+        extract_mem = client.extract_mem_from_tres
+        count_nodes = client.count_nodes_from_nodelist
+        combine_nodelist_reason = client.combine_nodelist_reason
+        for (
+            jobid,
+            user,
+            state,
+            partition,
+            tres,
+            gpu_display,
+            time_used,
+            time_limit,
+            name,
+            req_nodes,
+            nodelist,
+            reason,
+        ) in map(_TRES_JOB_FIELDS, jobs):
+            rows[jobid if jobid not in rows else _unique_row_key(rows, jobid)] = (
+                jobid,
+                user,
+                format_state(state),
+                partition,
+                extract_cpus(tres),
+                extract_mem(tres),
+                gpu_display,
+                format_time(time_used, time_limit),
+                time_limit,
+                name,
+                req_nodes,
+                count_nodes(nodelist),
+                combine_nodelist_reason(nodelist, reason),
+            )
+        return rows
+
+    def _build_basic_job_rows(self, jobs: List[Dict[str, Any]]) -> Dict[str, tuple]:
+        """Format jobs from the basic squeue -o layout."""
+        rows: Dict[str, tuple] = {}
+        format_state = self._format_state
+        count_nodes = self.client.count_nodes_from_nodelist
+        for jobid, user, state, partition, cpus, mem, time_used, name, nodelist in map(_BASIC_JOB_FIELDS, jobs):
+            rows[jobid if jobid not in rows else _unique_row_key(rows, jobid)] = (
+                jobid,
+                user,
+                format_state(state),
+                partition,
+                cpus,
+                mem,
+                time_used,
+                name,
+                count_nodes(nodelist),
+                nodelist,
+            )
+        return rows
+
+    async def _apply_job_rows(self, columns: tuple, rows: Dict[str, tuple]) -> None:
+        """Apply formatted job rows to the jobs table."""
+        table = self._jobs_table
+
+        # Remember the selected job (not the row index) so reordering keeps it selected
+        saved_cursor_row = table.cursor_coordinate.row
+        saved_cursor_key = None
+        if table.is_valid_coordinate(table.cursor_coordinate):
+            saved_cursor_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
+
+        if columns != self._jobs_schema:
+            self._reset_table(table, self._jobs_cache, columns)
+            self._jobs_schema = columns
+
+        # Keep the squeue ordering unless the user sorted by a column
+        changed_columns = await self._sync_rows(
+            table, self._jobs_cache, columns, rows, ("JOBID",), keep_order=not self._sort_column
+        )
+        # Removals and edits to other columns leave the table sorted from the previous refresh
+        if self._sort_column in changed_columns:
+            self._apply_current_sort()
 
         if table.row_count:
-            with contextlib.suppress(Exception):
-                if saved_cursor_row is not None and saved_cursor_row < table.row_count:
-                    table.move_cursor(row=saved_cursor_row)
-                elif table.cursor_coordinate is None:
-                    table.move_cursor(row=0)
+            if saved_cursor_key is not None and saved_cursor_key in table.rows:
+                table.move_cursor(row=table.get_row_index(saved_cursor_key))
+            elif saved_cursor_row < table.row_count:
+                table.move_cursor(row=saved_cursor_row)
+            else:
+                table.move_cursor(row=table.row_count - 1)
 
-    # Regex for parsing GPU GRES strings
-    _GPU_GRES_PATTERN = re.compile(r"\((?:IDX|S):[^)]*\)")
+    # Count of each gpu GRES entry, e.g. "gpu:h100:8(S:0-1)" or "gpu:(null):8(IDX:0-7)"
+    _GPU_COUNT_PATTERN = re.compile(r"gpu:(?:(?:\(null\)|[^:,(]+):)?(\d+)")
 
-    def _parse_gpu_count(self, gres_str: str) -> int:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_gpu_count(gres_str: str) -> int:
         """Parse GPU count from GRES string. Handles formats like:
         - gpu:h100:8
         - gpu:8
         - gpu:8(S:0-1)
         - gpu:(null):8(IDX:0-7)
+        - gpu:a100:4,gpu:v100:2 (counts are summed)
         """
         if not gres_str or gres_str in ("(null)", "-", "N/A"):
             return 0
-        try:
-            # Remove trailing (IDX:...) or (S:...) but keep (null)
-            clean = self._GPU_GRES_PATTERN.sub("", gres_str)
-            parts = clean.split(":")
-            # Find the last numeric part
-            for part in reversed(parts):
-                if part.isdigit():
-                    return int(part)
-        except (ValueError, IndexError):
-            pass
-        return 0
+        return sum(int(count) for count in SlurmDashboard._GPU_COUNT_PATTERN.findall(gres_str))
 
-    def _format_gpu_bar(self, gres: str, gres_used: str = "") -> Text:
+    # Node cells repeat across nodes and refreshes, so the rendered Text is memoized on the raw fields
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_gpu_bar(gres: str, gres_used: str = "") -> Text:
         """Format GPU info as a visual progress bar."""
-        gpu_info = self.client.parse_node_gpu_info(gres)
+        gpu_info = SlurmClient.parse_node_gpu_info(gres)
         if not gpu_info or gpu_info == "-":
             return Text("-", style="dim")
 
-        total = self._parse_gpu_count(gres)
-        used = self._parse_gpu_count(gres_used)
+        total = SlurmDashboard._parse_gpu_count(gres)
+        used = SlurmDashboard._parse_gpu_count(gres_used)
 
         if total == 0:
             return Text(gpu_info)
 
         # Ensure used doesn't exceed total
-        used = min(used, total)
-        avail = total - used
-
-        # Create visual bar
-        bar_used = "█" * used
-        bar_avail = "░" * avail
-        text = Text()
-        if used > 0:
-            text.append(bar_used, style="dark_orange")
-        if avail > 0:
-            text.append(bar_avail, style="grey50")
-        text.append(f" {used}/{total}", style="cyan")
-        return text
-
-    def _format_cpu_usage(self, cpus_state: str) -> Text:
+        return _gpu_bar(min(used, total), total)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_cpu_usage(cpus_state: str) -> Text:
         """Format CPU usage from CPUsState field (Alloc/Idle/Other/Total)."""
         if not cpus_state:
             return Text("-", style="dim")
@@ -638,7 +1115,9 @@ class SlurmDashboard(App):
             pass
         return Text(cpus_state)
 
-    def _format_mem_usage(self, alloc_mem: str, total_mem: str) -> Text:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_mem_usage(alloc_mem: str, total_mem: str) -> Text:
         """Format memory usage as alloc/total in human-readable format."""
         if not total_mem:
             return Text("-", style="dim")
@@ -659,27 +1138,40 @@ class SlurmDashboard(App):
             pass
         return Text(f"{alloc_mem}/{total_mem}" if alloc_mem else total_mem)
 
-    def _populate_nodes(self, nodes: List[Dict[str, Any]]) -> None:
+    async def _populate_nodes(self, nodes: List[Dict[str, Any]]) -> None:
         """Populate the nodes table with data."""
-        table: DataTable = self.query_one("#nodes_table", DataTable)
-        table.clear(columns=True)
-
-        columns = ["NODE", "STATE", "AVAIL", "GPUs", "CPUS", "MEM", "PARTITION"]
-        table.add_columns(*columns)
+        await self._apply_node_rows(self._build_node_rows(nodes))
+
+    def _build_node_rows(self, nodes: List[Dict[str, Any]]) -> Dict[str, tuple]:
+        """Format node dicts into table rows keyed by NODE@PARTITION."""
+        # sinfo -N lists a node once per partition
+        rows: Dict[str, tuple] = {}
+        format_state = self._format_state
+        format_gpu_bar = self._format_gpu_bar
+        format_cpu_usage = self._format_cpu_usage
+        format_mem_usage = self._format_mem_usage
         for n in nodes:
-            state = n.get("STATE", "")
-            gpu_display = self._format_gpu_bar(n.get("GRES", ""), n.get("GRES_USED", ""))
-            cpu_display = self._format_cpu_usage(n.get("CPUS_STATE", ""))
-            mem_display = self._format_mem_usage(n.get("ALLOC_MEM", ""), n.get("MEM", ""))
-            table.add_row(
-                n.get("NODE", ""),
-                self._format_state(state, is_node=True),
-                n.get("AVAIL", ""),
-                gpu_display,
-                cpu_display,
-                mem_display,
-                n.get("PARTITION", ""),
+            get = n.get
+            node = get("NODE", "")
+            partition = get("PARTITION", "")
+            rows[f"{node}@{partition}"] = (
+                node,
+                format_state(get("STATE", ""), True),
+                get("AVAIL", ""),
+                format_gpu_bar(get("GRES", ""), get("GRES_USED", "")),
+                format_cpu_usage(get("CPUS_STATE", "")),
+                format_mem_usage(get("ALLOC_MEM", ""), get("MEM", "")),
+                partition,
             )
+        return rows
+
+    async def _apply_node_rows(self, rows: Dict[str, tuple]) -> None:
+        """Apply formatted node rows to the nodes table."""
+        table = self._nodes_table
+        if self._nodes_schema is None:
+            self._reset_table(table, self._nodes_cache, _NODE_COLUMNS)
+            self._nodes_schema = _NODE_COLUMNS
+        await self._sync_rows(table, self._nodes_cache, _NODE_COLUMNS, rows, ("NODE", "PARTITION"))
 
     async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in jobs or nodes table."""
@@ -700,18 +1192,35 @@ class SlurmDashboard(App):
             return
         jobid = str(row[0])
 
-        self.current_jobid = jobid
+        # User activity: poll at the base rate again
+        if self._dynamic_interval > self.refresh_sec:
+            self._update_refresh_timer()
         job_state = row[2]
         # Handle both plain string and Rich Text objects
         state_str = job_state.plain if hasattr(job_state, "plain") else str(job_state)
-        can_refresh = state_str.upper() in ["RUNNING", "PENDING"]
+        can_refresh = state_str in _ACTIVE_JOB_STATES
         self.output_refresh_enabled = self.user_wants_realtime and can_refresh
 
+        if jobid == self.current_jobid:
+            if any(w.group == "job_details" and w.is_running for w in self.workers):
+                # Still loading this job
+                return
+            if self._output_paths is not None:
+                # Details are shown already; only pick up output written since
+                self.run_worker(
+                    self._refresh_current_output(), group="output_refresh", exclusive=True, exit_on_error=False
+                )
+                return
+
+        self.current_jobid = jobid
+        self._output_paths = None
+        self._tail_offsets = None
+
         # Show loading indicators immediately
-        self.query_one("#job_detail", Static).update(f"[b]Job {jobid}[/b]\nLoading...")
-        self.query_one("#script_viewer", SyntaxViewer).set_code("# Loading...", "bash")
-        self.query_one("#stdout_viewer", LogViewer).set_content("Loading...")
-        self.query_one("#stderr_viewer", LogViewer).set_content("Loading...")
+        self._job_detail.update(f"[b]Job {jobid}[/b]\nLoading...")
+        self._script_viewer.set_code("# Loading...", "bash")
+        self._stdout_viewer.set_content("Loading...")
+        self._stderr_viewer.set_content("Loading...")
 
         # Load data asynchronously - use worker to handle exceptions properly
         self.run_worker(
@@ -743,29 +1252,48 @@ class SlurmDashboard(App):
         node_jobs = await self.client.get_jobs_on_node(node_name)
         self.push_screen(NodeJobsModal(node_name, node_jobs))
 
+    def _cached_job_detail(self, jobid: str) -> Optional[Tuple[str, str]]:
+        """Return cached (detail, script) for a job if still fresh."""
+        cached = self._detail_cache.get(jobid)
+        if cached is None:
+            return None
+        detail, script_text, fetched_at = cached
+        state = self._job_state(jobid)
+        finished = state is not None and state not in _ACTIVE_JOB_STATES
+        if finished or time.monotonic() - fetched_at < _DETAIL_CACHE_TTL:
+            return detail, script_text
+        return None
+
     async def _load_job_details(self, jobid: str, can_refresh: bool) -> None:
         """Load job details, script, and output asynchronously."""
         try:
-            # Load detail and script in parallel first
-            detail, script_text = await asyncio.gather(
-                self.client.get_job_detail(jobid),
-                self.client.get_job_script(jobid),
-            )
+            cached = self._cached_job_detail(jobid)
+            if cached is not None:
+                detail, script_text = cached
+                stdout, stderr, offsets = await self.client.get_job_output_tail(jobid, detail=detail)
+            else:
+                # One round trip: the output paths come from the same scontrol call, which the client shares
+                detail, script_text, (stdout, stderr, offsets) = await asyncio.gather(
+                    self.client.get_job_detail(jobid),
+                    self.client.get_job_script(jobid),
+                    self.client.get_job_output_tail(jobid),
+                )
+                if not detail.startswith("Failed to get job detail"):
+                    self._detail_cache.pop(jobid, None)
+                    if len(self._detail_cache) >= _DETAIL_CACHE_SIZE:
+                        del self._detail_cache[next(iter(self._detail_cache))]
+                    self._detail_cache[jobid] = (detail, script_text, time.monotonic())
 
             # Check if still relevant before continuing
             if self.current_jobid != jobid:
                 return
 
-            # Update detail and script immediately
-            self.query_one("#job_detail", Static).update(f"[b]Job {jobid}[/b]\n{detail}")
-            self.query_one("#script_viewer", SyntaxViewer).set_code(script_text, "bash")
-
-            # Load output using the already-fetched detail (avoids duplicate scontrol call)
-            stdout, stderr = await self.client.get_job_output(jobid, detail=detail)
-
-            if self.current_jobid != jobid:
-                return
-
+            if not detail.startswith("Failed to get job detail"):
+                # Output refreshes only re-read the files from here on
+                self._output_paths = await self.client.get_job_output_paths(jobid, detail)
+            self._job_detail.update(f"[b]Job {jobid}[/b]\n{detail}")
+            self._script_viewer.set_code(script_text, "bash")
+            self._tail_offsets = offsets
             self._update_output_display(jobid, stdout, stderr, can_refresh)
 
         except Exception as e:
@@ -774,40 +1302,28 @@ class SlurmDashboard(App):
 
     def _update_output_display(self, jobid: str, stdout: str, stderr: str, can_refresh: bool) -> None:
         """Update output display panels."""
-        self.query_one("#stdout_viewer", LogViewer).set_content(stdout or "No stdout available")
-        self.query_one("#stderr_viewer", LogViewer).set_content(stderr or "No stderr available")
+        self._stdout_viewer.set_content(stdout or "No stdout available")
+        self._stderr_viewer.set_content(stderr or "No stderr available")
 
         # Update status with refresh info
-        if self.user_wants_realtime and can_refresh:
-            self.status.message = f"Job {jobid} selected | 🔄 Real-time ON"
-        else:
-            self.status.message = f"Job {jobid} selected | Press 't' to enable real-time"
-
-    def _sort_key(self, value: Any) -> tuple:
-        """Sort key function that uses self._sort_column to determine sort type."""
-        text = value.plain if hasattr(value, "plain") else str(value)
-        text = text.strip()
-        col = self._sort_column
+        hint = _REALTIME_HINTS[bool(self.user_wants_realtime and can_refresh)]
+        self.status.message = f"Job {jobid} selected{hint}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _sort_key(column: str) -> Callable[[Any], tuple]:
+        """Build the sort key function for a column, once per column."""
+        parse = _SORT_KEY_PARSERS.get(column, _text_sort_key)
+
+        def key(value: Any) -> tuple:
+            # Most columns hold plain strings; an exact type check is the cheapest test for them
+            if value.__class__ is str:
+                text = value
+            else:
+                text = value.plain if isinstance(value, Text) else str(value)
+            return parse(text.strip())
 
-        if col in _INT_COLUMNS:
-            try:
-                return (0, int(text))
-            except ValueError:
-                return (1, text.lower())
-
-        if col in _MEM_COLUMNS:
-            match = _MEM_PATTERN.match(text)
-            if match:
-                num_str, unit = match.groups()
-                try:
-                    num = float(num_str)
-                    mult = _MEM_UNITS.get(unit.upper(), 1) if unit else 1
-                    return (0, int(num * mult))
-                except ValueError:
-                    pass
-            return (1, text.lower())
-
-        return (0, text.lower())
+        return key
 
     def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
         """Handle header click for sorting."""
@@ -822,50 +1338,83 @@ class SlurmDashboard(App):
         column_name: str = raw_name
 
         # Toggle sort direction if same column
-        if self._sort_column == column_name:
+        toggled = self._sort_column == column_name
+        if toggled:
             self._sort_reverse = not self._sort_reverse
         else:
             self._sort_column = column_name
             # For numeric columns (INT/MEM), start with descending (largest first)
-            if column_name in _INT_COLUMNS or column_name in _MEM_COLUMNS:
-                self._sort_reverse = True
-            else:
-                self._sort_reverse = False
+            self._sort_reverse = column_name in _SORT_KEY_PARSERS
 
         # Sort the table
         table = event.data_table
         try:
-            table.sort(column_key, key=self._sort_key, reverse=self._sort_reverse)
-            self._update_column_headers(table)
-            arrow = "▼" if self._sort_reverse else "▲"
-            self.status.message = f"Sorted by {column_name} {arrow}"
+            # Reordered rows and relabelled headers reach the screen in one repaint
+            with self.batch_update():
+                if toggled:
+                    # Rows are already sorted by this column, so flip their order without re-parsing cells.
+                    # sort() computes one key per row in table.rows order, so positions go by row key.
+                    positions = {row.key: index for index, row in enumerate(table.ordered_rows)}
+                    order = iter([positions[row_key] for row_key in table.rows])
+                    table.sort(key=lambda _cells: next(order), reverse=True)
+                else:
+                    table.sort(column_key, key=self._sort_key(column_name), reverse=self._sort_reverse)
+                self._update_column_headers(table)
+            self.status.message = f"Sorted by {column_name} {_SORT_ARROWS[self._sort_reverse]}"
         except Exception as e:
             self.status.message = f"Sort error: {e}"
 
     def _update_column_headers(self, table: DataTable) -> None:
         """Update column headers to reflect current sort state."""
-        for col_key in table.columns:
-            col = table.columns[col_key]
-            # Extract actual column name from ColumnKey object
-            base_name = col_key.value if hasattr(col_key, "value") else str(col_key)
-            if base_name is None:
+        for col_key, col in table.columns.items():
+            # Columns are keyed by their name when the table is built
+            if col_key.value is None:
                 continue
-            if self._sort_column == base_name:
-                arrow = "▼" if self._sort_reverse else "▲"
-                col.label = Text(f"{base_name} {arrow}")
-            else:
-                col.label = Text(base_name)
-
-    async def on_input_submitted(self, event: Input.Submitted) -> None:
+            label = self._get_column_label(col_key.value)
+            # Only the previous and new sort columns actually change
+            if col.label is not label:
+                col.label = label
+
+    def check_action(self, action: str, parameters: Tuple[object, ...]) -> Optional[bool]:
+        """Disable the job actions outside the Jobs tab, wherever the focus is."""
+        if action in _JOB_ACTIONS:
+            return self.query_one(TabbedContent).active == "tab_jobs"
+        return True
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Update the footer's job actions and catch up on node changes missed while the Nodes tab was hidden."""
+        self.refresh_bindings()
+        if event.pane.id == "tab_nodes" and time.monotonic() - self._nodes_refreshed_at >= _NODE_REFRESH_INTERVAL:
+            self._schedule_nodes_refresh()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission."""
         text = event.value.strip()
         if event.input.id in ("job_search", "node_search"):
+            # Enter on an unchanged search would only repeat the same squeue/sinfo calls
+            if text == self.filter.text:
+                return
             self.filter.text = text
-            await self.refresh_data()
+            self._schedule_filter_refresh()
 
-    async def on_select_changed(self, event: Select.Changed) -> None:
+    def on_select_changed(self, event: Select.Changed) -> None:
         """Handle state filter selection change."""
         if event.select.id == "state_filter":
             value = event.value
-            self.filter.state = str(value) if value else None
-            await self.refresh_data()
+            state = str(value) if value else None
+            # Select also posts Changed when it is first mounted
+            if state == self.filter.state:
+                return
+            self.filter.state = state
+            self._schedule_filter_refresh()
+
+    def _schedule_filter_refresh(self) -> None:
+        """Refresh the tables once the filter has stopped changing."""
+        if self._filter_timer:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(_FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_timer = None
+        # Filters are applied client-side, so the last squeue/sinfo results can be reused
+        self.run_worker(self.refresh_data(fetch=False), group="filter_refresh", exclusive=True, exit_on_error=False)
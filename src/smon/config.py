@@ -1,13 +1,31 @@
 """Configuration management for smon."""
 
+import functools
 import json
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
-@dataclass
+@functools.lru_cache(maxsize=4)
+def _read_config_data(path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Read and parse a config file; keyed on its stat so edits and saves invalidate the cache."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _config_path(xdg_config_home: Optional[str]) -> Path:
+    """Resolve the config file path for a given $XDG_CONFIG_HOME (unset or empty means ~/.config)."""
+    config_home = Path(xdg_config_home) if xdg_config_home else Path.home() / ".config"
+    return config_home / "smon" / "config.json"
+
+
+@dataclass(slots=True)
 class Config:
     """User configuration settings."""
 
@@ -21,35 +39,36 @@ class Config:
     @classmethod
     def config_path(cls) -> Path:
         """Get the configuration file path."""
-        config_dir = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "smon"
-        return config_dir / "config.json"
+        return _config_path(os.environ.get("XDG_CONFIG_HOME"))
 
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from file."""
         config_path = cls.config_path()
-        if config_path.exists():
-            try:
-                with open(config_path, "r") as f:
-                    data = json.load(f)
-                return cls(
-                    refresh_sec=data.get("refresh_sec", 5.0),
-                    user_filter=data.get("user_filter"),
-                    partition_filter=data.get("partition_filter"),
-                    state_filter=data.get("state_filter"),
-                    theme=data.get("theme", "dark"),
-                    gpustat_web_url=data.get("gpustat_web_url"),
-                )
-            except (json.JSONDecodeError, IOError):
-                pass
-        return cls()
+        try:
+            stat = config_path.stat()
+        except OSError:
+            return cls()
+        data = _read_config_data(str(config_path), stat.st_mtime_ns, stat.st_size)
+        if data is None:
+            return cls()
+        return cls(
+            refresh_sec=data.get("refresh_sec", 5.0),
+            user_filter=data.get("user_filter"),
+            partition_filter=data.get("partition_filter"),
+            state_filter=data.get("state_filter"),
+            theme=data.get("theme", "dark"),
+            gpustat_web_url=data.get("gpustat_web_url"),
+        )
 
     def save(self) -> None:
         """Save configuration to file."""
         config_path = self.config_path()
         config_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(config_path, "w") as f:
-                json.dump(asdict(self), f, indent=2)
+            # All fields are flat scalars, so they need no deep copy via asdict();
+            # the indent is kept because the file is meant to be edited by hand
+            data = {field.name: getattr(self, field.name) for field in fields(self)}
+            config_path.write_text(json.dumps(data, indent=2))
         except IOError:
             pass
@@ -1,9 +1,10 @@
 """GPUstat-web client for fetching GPU status via WebSocket."""
 
 import asyncio
+import functools
 import re
 from html import unescape
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 try:
@@ -14,12 +15,26 @@ except ImportError:
     HAS_WEBSOCKETS = False
 
 # Pre-compiled regex patterns for HTML parsing
-_SCRIPT_PATTERN = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
-_STYLE_PATTERN = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
-_PRE_PATTERN = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
-_SPAN_PATTERN = re.compile(r'<span[^>]*class="([^"]*)"[^>]*>(.*?)</span>', re.DOTALL)
+# Block boundaries are located tag by tag; a lazy ".*?" over the block body
+# makes the regex engine step through every character of the frame. The
+# shared "<" is factored out so the search can skip ahead to the next tag.
+_BLOCK_PATTERN = re.compile(r"<(?:(script|style)[^>]*>|(pre)[^>]*>|(/pre>))", re.IGNORECASE)
+_BLOCK_CLOSE_PATTERNS = {
+    "script": re.compile(r"</script>", re.IGNORECASE),
+    "style": re.compile(r"</style>", re.IGNORECASE),
+}
+# Styled spans and every other tag in one alternation, so the body is rewritten in a single pass
+_MARKUP_PATTERN = re.compile(r'<span[^>]*class="([^"]*)"[^>]*>(.*?)</span>|<[^>]+>', re.DOTALL)
 _TAG_PATTERN = re.compile(r"<[^>]+>")
 
+# gpustat-web renders a frame only in reply to a query, so this (seconds) is the
+# update period; a quiet connection is re-queried after this long
+_QUERY_INTERVAL = 10.0
+_QUERY_MESSAGE = '{"message": "query"}'
+
+# Frames smaller than this (bytes) parse faster inline than the thread hop costs
+_INLINE_PARSE_SIZE = 4096
+
 # ANSI CSS class to Rich style mapping
 _ANSI_COLOR_MAP = {
     "ansi32": "green",  # Green (OK status)
@@ -46,7 +61,9 @@ class GpustatClient:
         self._ws_url = self._http_to_ws_url(url)
         self._ws = None
         self._running = False
+        self._stopped = asyncio.Event()  # Set by disconnect() to cut a reconnect backoff short
         self._task: Optional[asyncio.Task] = None
+        self._last_frame: Optional[bytes] = None  # Raw payload of the last frame passed on
 
     @staticmethod
     def _http_to_ws_url(http_url: str) -> str:
@@ -71,41 +88,45 @@ class GpustatClient:
             return
 
         self._running = True
+        self._stopped.clear()
         retry_delay = 1.0
 
         while self._running:
             try:
                 async with ws_connect(self._ws_url) as ws:
                     self._ws = ws
+                    self._last_frame = None  # Always show the first frame after (re)connecting
                     retry_delay = 1.0  # Reset on successful connection
 
                     # Send initial query
-                    await ws.send('{"message": "query"}')
+                    await ws.send(_QUERY_MESSAGE)
 
                     while self._running:
                         try:
-                            raw_message = await asyncio.wait_for(ws.recv(), timeout=10.0)
-                            if isinstance(raw_message, str):
-                                message = raw_message
-                            else:
-                                message = bytes(raw_message).decode("utf-8", errors="replace")
-                            parsed = self._parse_html_to_text(message)
-                            on_message(parsed)
+                            # Undecoded, so a repeated frame is dropped before any UTF-8 decoding
+                            raw_message = await asyncio.wait_for(ws.recv(decode=False), timeout=_QUERY_INTERVAL)
+                            parsed = await self._parse_frame(raw_message)
+                            if parsed is not None:
+                                on_message(parsed)
                         except asyncio.TimeoutError:
-                            # Send ping to keep connection alive
-                            await ws.send('{"message": "query"}')
+                            # Ask for a fresh frame; websockets' own pings keep the connection alive
+                            await ws.send(_QUERY_MESSAGE)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 if self._running:
                     on_message(f"[red]Connection error: {e}[/red]\nRetrying in {retry_delay:.0f}s...")
-                    await asyncio.sleep(retry_delay)
+                    try:
+                        await asyncio.wait_for(self._stopped.wait(), timeout=retry_delay)
+                    except TimeoutError:
+                        pass
                     retry_delay = min(retry_delay * 2, 30.0)
 
     async def disconnect(self) -> None:
         """Disconnect from gpustat-web."""
         self._running = False
+        self._stopped.set()
         if self._ws:
             await self._ws.close()
             self._ws = None
@@ -117,40 +138,91 @@ class GpustatClient:
                 pass
             self._task = None
 
+    async def _parse_frame(self, frame: bytes) -> Optional[str]:
+        """Decode and parse a received frame, or return None if it repeats the previous one.
+
+        gpustat-web answers every keepalive query, so unchanged frames are common.
+        Large frames are parsed in a worker thread to keep the event loop responsive.
+        """
+        if frame == self._last_frame:
+            return None
+        self._last_frame = frame
+        if len(frame) < _INLINE_PARSE_SIZE:
+            return self._decode_frame(frame)
+        return await asyncio.to_thread(self._decode_frame, frame)
+
+    def _decode_frame(self, frame: bytes) -> str:
+        """Decode a raw frame and parse it to displayable text."""
+        return self._parse_html_to_text(frame.decode("utf-8", errors="replace"))
+
+    @staticmethod
+    def _extract_body(html: str) -> str:
+        """Drop script and style blocks and keep the first pre block's content.
+
+        gpustat output is usually in pre; without a complete pre block the
+        whole frame is kept. The frame is walked once from block tag to block tag.
+        """
+        parts: List[str] = []
+        pre_start = -1  # Index into parts where the pre block's content begins
+        pos = 0
+        while True:
+            match = _BLOCK_PATTERN.search(html, pos)
+            if match is None:
+                break
+            skipped = match.group(1)
+            if skipped:
+                close = _BLOCK_CLOSE_PATTERNS[skipped.lower()].search(html, match.end())
+                if close is not None:
+                    parts.append(html[pos : match.start()])
+                    pos = close.end()
+                    continue
+            elif match.group(3) and pre_start >= 0:
+                parts.append(html[pos : match.start()])
+                return "".join(parts[pre_start:])
+            parts.append(html[pos : match.end()])
+            pos = match.end()
+            if match.group(2) and pre_start < 0:
+                pre_start = len(parts)
+        parts.append(html[pos:])
+        return "".join(parts)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _ansi_markup(classes: str) -> Tuple[str, str]:
+        """Map a span's class attribute to Rich open/close tags (empty if it has no ANSI class)."""
+        if "ansi" in classes:
+            style = " ".join([style for cls, style in _ANSI_COLOR_MAP.items() if cls in classes])
+            if style:
+                return f"[{style}]", f"[/{style}]"
+        return "", ""
+
+    @staticmethod
+    def _replace_markup(match: "re.Match[str]") -> str:
+        """Turn a styled span into Rich markup and drop any other tag."""
+        classes = match.group(1)
+        if classes is None:
+            return ""
+        content = match.group(2)
+        if "<" in content:
+            content = _TAG_PATTERN.sub("", content)
+        open_tag, close_tag = GpustatClient._ansi_markup(classes)
+        if open_tag:
+            return open_tag + content + close_tag
+        return content
+
     def _parse_html_to_text(self, html: str) -> str:
         """Parse HTML content from gpustat-web to displayable text.
 
         Converts ANSI CSS classes back to Rich markup for terminal display.
         """
-        # Remove script and style tags
-        html = _SCRIPT_PATTERN.sub("", html)
-        html = _STYLE_PATTERN.sub("", html)
-
-        # Extract content from pre tags (gpustat output is usually in pre)
-        pre_match = _PRE_PATTERN.search(html)
-        if pre_match:
-            html = pre_match.group(1)
-
-        # Replace span tags with Rich markup
-        def replace_span(match: re.Match[str]) -> str:
-            classes = match.group(1)
-            content = match.group(2)
-            styles = [style for cls, style in _ANSI_COLOR_MAP.items() if cls in classes]
-            if styles:
-                style_str = " ".join(styles)
-                return f"[{style_str}]{content}[/{style_str}]"
-            return content
-
-        html = _SPAN_PATTERN.sub(replace_span, html)
-
-        # Remove remaining HTML tags and unescape entities
-        html = unescape(_TAG_PATTERN.sub("", html))
-
-        # Clean up whitespace - strip leading/trailing empty lines
-        lines = [line.rstrip() for line in html.split("\n")]
-        while lines and not lines[0].strip():
-            lines.pop(0)
-        while lines and not lines[-1].strip():
-            lines.pop()
-
-        return "\n".join(lines)
+        # Frames without tags or entities skip the regex and unescape passes
+        if "<" in html:
+            html = self._extract_body(html)
+            # Replace span tags with Rich markup and drop other tags
+            html = _MARKUP_PATTERN.sub(self._replace_markup, html)
+        if "&" in html:
+            html = unescape(html)
+
+        # Clean up whitespace - strip trailing spaces, then leading/trailing empty lines
+        # (after rstrip a blank line is empty, so stripping newlines removes them all)
+        return "\n".join([line.rstrip() for line in html.split("\n")]).strip("\n")
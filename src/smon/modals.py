@@ -1,24 +1,26 @@
 """Modal screens for smon dashboard.
 
-Note: These modals are currently not used in the main application.
+Used by the main application:
+- NodeJobsModal: Jobs running on the node selected in the Nodes tab.
+- CancelConfirmModal: Confirmation before cancelling a job with 'c'.
+
+Not currently used, kept for potential future use or as reference:
 - ScriptModal: Script is now displayed inline in the split view.
 - OutputModal: Output is now viewed via external pager (bat/less) with 'o' key.
-
-These classes are kept for potential future use or as reference.
 """
 
-import datetime
 from typing import TYPE_CHECKING, Any, Dict, List
 
-from rich.syntax import Syntax
 from rich.table import Table
+from textual import events
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import ScrollableContainer, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Static
 
-from .widgets import LogViewer
+from .utils import now_hms
+from .widgets import CachedSyntax, LogViewer
 
 if TYPE_CHECKING:
     from .slurm_client import SlurmClient
@@ -45,7 +47,7 @@ class ScriptModal(ModalScreen):
                 id="script_header",
                 classes="script-header",
             )
-            syntax = Syntax(
+            syntax = CachedSyntax(
                 self.script_content,
                 "bash",
                 theme="monokai",
@@ -91,21 +93,22 @@ class OutputModal(ModalScreen):
                     classes="output-section-header",
                 )
                 with ScrollableContainer(classes="output-scroll-container"):
-                    yield LogViewer(
-                        self.stdout or "[dim]No stdout available[/dim]",
-                        id="modal_stdout_viewer",
-                        classes="output-log-viewer",
-                    )
+                    yield LogViewer(id="modal_stdout_viewer", classes="output-log-viewer")
                 yield Static(
                     "[bold bright_red]📥 STDERR[/bold bright_red]",
                     classes="output-section-header",
                 )
                 with ScrollableContainer(classes="output-scroll-container"):
-                    yield LogViewer(
-                        self.stderr or "[dim]No stderr available[/dim]",
-                        id="modal_stderr_viewer",
-                        classes="output-log-viewer",
-                    )
+                    yield LogViewer(id="modal_stderr_viewer", classes="output-log-viewer")
+
+    def on_mount(self) -> None:
+        """Cache widgets updated on every refresh and fill in the initial output."""
+        self._header = self.query_one("#output_header", Static)
+        self._stdout_viewer = self.query_one("#modal_stdout_viewer", LogViewer)
+        self._stderr_viewer = self.query_one("#modal_stderr_viewer", LogViewer)
+        # Through set_content, so long outputs are cut to the viewer's line limit
+        self._stdout_viewer.set_content(self.stdout or "[dim]No stdout available[/dim]")
+        self._stderr_viewer.set_content(self.stderr or "[dim]No stderr available[/dim]")
 
     async def action_dismiss(self, result=None) -> None:
         """Close the modal."""
@@ -116,23 +119,18 @@ class OutputModal(ModalScreen):
         try:
             stdout, stderr = await self.client.get_job_output(self.jobid, full=True)
 
-            stdout_viewer = self.query_one("#modal_stdout_viewer", LogViewer)
-            stdout_viewer.set_content(stdout or "No stdout available")
+            self._stdout_viewer.set_content(stdout or "No stdout available")
+            self._stderr_viewer.set_content(stderr or "No stderr available")
 
-            stderr_viewer = self.query_one("#modal_stderr_viewer", LogViewer)
-            stderr_viewer.set_content(stderr or "No stderr available")
-
-            refresh_time = datetime.datetime.now().strftime("%H:%M:%S")
-            header = self.query_one("#output_header", Static)
-            header.update(
+            refresh_time = now_hms()
+            self._header.update(
                 f"[bold bright_green]📊 Job Output - Job {self.jobid}[/bold bright_green]\n"
                 f"[dim]Last refreshed: {refresh_time} | "
                 f"Press [bold]Escape[/bold]/[bold]q[/bold] to close, "
                 f"[bold]r[/bold] to refresh[/dim]"
             )
         except Exception as e:
-            header = self.query_one("#output_header", Static)
-            header.update(
+            self._header.update(
                 f"[bold bright_green]📊 Job Output - Job {self.jobid}[/bold bright_green]\n"
                 f"[bold red]Refresh error: {e}[/bold red]"
             )
@@ -207,3 +205,29 @@ class NodeJobsModal(ModalScreen[None]):
     async def action_dismiss(self, result: None = None) -> None:
         """Close the modal."""
         self.dismiss(result)
+
+
+class CancelConfirmModal(ModalScreen[bool]):
+    """Modal asking to confirm cancelling a job: 'c' confirms, any other key aborts."""
+
+    CSS = """
+    CancelConfirmModal {
+        align: center middle;
+    }
+    """
+
+    def __init__(self, jobid: str) -> None:
+        super().__init__()
+        self.jobid = jobid
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="cancel_confirm_container"):
+            yield Static(
+                f"[bold yellow]⚠️ Cancel job {self.jobid}?[/bold yellow]\n"
+                f"[dim]Press [bold]c[/bold] again to confirm, any other key to abort[/dim]"
+            )
+
+    def on_key(self, event: events.Key) -> None:
+        event.stop()
+        event.prevent_default()
+        self.dismiss(event.key == "c")
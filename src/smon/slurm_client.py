@@ -1,6 +1,9 @@
 """Slurm client for interacting with Slurm commands."""
 
 import asyncio
+import contextlib
+import functools
+import os
 import re
 import shlex
 from dataclasses import dataclass
@@ -34,6 +37,8 @@ class SlurmClient:
     ]
     CPU_PATTERN = re.compile(r"cpu=(\d+)")
     MEM_PATTERN = re.compile(r"mem=([0-9]+[KMGT]?)")
+    # squeue error output for an option this Slurm version does not know
+    OPTION_REJECTED_PATTERN = re.compile(r"(?:unrecognized|invalid|unknown) option", re.IGNORECASE)
 
     # Reason keywords indicating pending state
     PENDING_REASONS = frozenset(
@@ -46,9 +51,23 @@ class SlurmClient:
         ]
     )
 
+    # Upper bound on how much of an output file is read per refresh
+    OUTPUT_TAIL_BYTES = 256 * 1024
+
+    # Number of job scripts kept in memory; a submitted job's script never changes
+    SCRIPT_CACHE_SIZE = 256
+
     def __init__(self, cmds: Optional[SlurmCommands] = None, mock_mode: bool = False) -> None:
         self.cmds = cmds or SlurmCommands()
         self._mock_mode = mock_mode
+        # In-flight `scontrol show job` calls, shared by concurrent callers for the same job
+        self._detail_requests: Dict[str, asyncio.Future[str]] = {}
+        # Batch scripts already fetched, oldest first
+        self._script_cache: Dict[str, str] = {}
+        # Set once squeue has rejected -O / --only-job-state but accepted the fallback,
+        # so later polls spawn only the command that works
+        self._squeue_basic_format = False
+        self._squeue_no_state_only = False
 
         # Check for required Slurm commands
         missing_cmds: List[str] = []
@@ -85,10 +104,18 @@ class SlurmClient:
             "NodeList",
             "Reason",
         ]
-        fmt = "JobID:10,Partition:12,NAME:36,USERNAME:10,STATE:10,TRES:50,TimeUsed:12,TimeLimit:14,ReqNodes,NodeList,Reason"
+        # Array and het-job ids (1234567_[1-100%10], 1234567+1) need the wide JobID field
+        fmt = (
+            "JobID:30,Partition:12,NAME:36,USERNAME:10,STATE:10,TRES:50,TimeUsed:12,TimeLimit:14,"
+            "ReqNodes,NodeList,Reason"
+        )
 
-        rc, out, err = await run_cmd(f"{self.cmds.squeue} -h -O '{fmt}' --states=all", timeout=10)
+        rc, out, err = 1, "", ""
+        if not self._squeue_basic_format:
+            rc, out, err = await run_cmd(f"{self.cmds.squeue} -h -O '{fmt}' --states=all", timeout=10)
         if rc != 0:
+            # -O needs a newer Slurm; only a rejected option, not a timeout, pins the basic layout
+            rejected = bool(self.OPTION_REJECTED_PATTERN.search(err))
             basic_fmt = "%i|%u|%T|%M|%D|%P|%j|%R|%C|%m"
             basic_cols = [
                 "JOBID",
@@ -105,8 +132,15 @@ class SlurmClient:
             rc, out, err = await run_cmd(f"{self.cmds.squeue} -h -o '{basic_fmt}' --states=all", timeout=10)
             if rc != 0:
                 raise RuntimeError(f"squeue failed: {err.strip() or 'unknown error'}")
+            if rejected:
+                self._squeue_basic_format = True
             cols = basic_cols
 
+        # Parsing a large queue is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._parse_jobs, out, cols)
+
+    def _parse_jobs(self, out: str, cols: List[str]) -> List[Dict[str, Any]]:
+        """Parse squeue output into job dicts keyed by ``cols``."""
         jobs: List[Dict[str, Any]] = []
         for line in out.splitlines():
             if not line.strip():
@@ -121,6 +155,8 @@ class SlurmClient:
                 continue
 
             row = {k: parts[i] if i < len(parts) else "" for i, k in enumerate(cols)}
+            # Truncated once here so the table doesn't slice it on every refresh
+            row["NAME_SHORT"] = row["NAME"][:30]
 
             if "TRES" in row:
                 row["GPU_COUNT"] = self._parse_gpu_count(row["TRES"])
@@ -158,6 +194,11 @@ class SlurmClient:
         if rc != 0:
             raise RuntimeError(f"sinfo failed: {err.strip() or 'unknown error'}")
 
+        return await asyncio.to_thread(self._parse_nodes, out, cols)
+
+    @staticmethod
+    def _parse_nodes(out: str, cols: List[str]) -> List[Dict[str, Any]]:
+        """Parse '|'-separated sinfo output into node dicts keyed by ``cols``."""
         nodes: List[Dict[str, Any]] = []
         for line in out.splitlines():
             parts = [p.strip() for p in line.split("|")]
@@ -167,15 +208,61 @@ class SlurmClient:
         return nodes
 
     async def get_job_detail(self, jobid: str) -> str:
-        """Get detailed information for a specific job."""
+        """Get detailed information for a specific job.
+
+        Concurrent calls for the same job share a single scontrol invocation.
+        """
         if self._mock_mode:
             return f"Mock details for Job {jobid}\nUser=alice State=RUNNING Nodes=1 CPUS=8 Mem=16G"
+        request = self._detail_requests.get(jobid)
+        if request is None:
+            request = asyncio.ensure_future(self._fetch_job_detail(jobid))
+            self._detail_requests[jobid] = request
+            request.add_done_callback(lambda _: self._detail_requests.pop(jobid, None))
+        # Shielded so a cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(request)
+
+    async def _fetch_job_detail(self, jobid: str) -> str:
         cmd = f"{self.cmds.scontrol} show job {shlex.quote(jobid)}"
         rc, out, err = await run_cmd(cmd, timeout=10)
         if rc != 0:
             return f"Failed to get job detail: {err.strip() or 'unknown error'}"
         return out.strip()
 
+    async def get_job_states(self, jobids: List[str]) -> Optional[Dict[str, str]]:
+        """Get the current state of several jobs with a single squeue call.
+
+        Jobs that squeue no longer reports are omitted from the result. Returns None if
+        squeue failed, since an empty result would mean every job has left the queue.
+        """
+        if not jobids:
+            return {}
+        if self._mock_mode:
+            wanted = set(jobids)
+            return {j["JOBID"]: j["STATE"] for j in self._mock_jobs() if j["JOBID"] in wanted}
+
+        ids = shlex.quote(",".join(jobids))
+        rc, out, err = 1, "", ""
+        if not self._squeue_no_state_only:
+            cmd = f"{self.cmds.squeue} -h --only-job-state -o '%i|%T' -j {ids}"
+            rc, out, err = await run_cmd(cmd, timeout=10)
+        if rc != 0:
+            # --only-job-state needs a recent Slurm; fall back to a regular query
+            rejected = bool(self.OPTION_REJECTED_PATTERN.search(err))
+            rc, out, _err = await run_cmd(f"{self.cmds.squeue} -h -o '%i|%T' -j {ids}", timeout=10)
+            if rc != 0:
+                return None
+            # A transient failure (timeout, slurmctld busy) is no reason to give up the option
+            if rejected:
+                self._squeue_no_state_only = True
+
+        states: Dict[str, str] = {}
+        for line in out.splitlines():
+            jobid, sep, state = line.partition("|")
+            if sep:
+                states[jobid.strip()] = state.strip()
+        return states
+
     async def get_jobs_on_node(self, node_name: str) -> List[Dict[str, Any]]:
         """Get jobs running on a specific node using squeue -w."""
         if self._mock_mode:
@@ -203,13 +290,23 @@ class SlurmClient:
         return jobs
 
     async def get_job_script(self, jobid: str) -> str:
-        """Get the batch script for a job."""
+        """Get the batch script for a job.
+
+        Scripts are immutable once a job is submitted, so each is fetched from the controller only once.
+        """
         if self._mock_mode:
             return f"#!/bin/bash\n#SBATCH --job-name=mock_job_{jobid}\necho 'Mock script'"
+        script = self._script_cache.get(jobid)
+        if script is not None:
+            return script
         cmd = f"{self.cmds.scontrol} write batch_script {shlex.quote(jobid)} -"
         rc, out, _err = await run_cmd(cmd, timeout=15)
         if rc == 0 and out.strip():
-            return out.rstrip()
+            script = out.rstrip()
+            if len(self._script_cache) >= SlurmClient.SCRIPT_CACHE_SIZE:
+                del self._script_cache[next(iter(self._script_cache))]
+            self._script_cache[jobid] = script
+            return script
         return "(No script stored by controller)"
 
     async def get_job_output_paths(self, jobid: str, detail: Optional[str] = None) -> Tuple[str, str]:
@@ -259,6 +356,120 @@ class SlurmClient:
         )
         return stdout_content, stderr_content
 
+    async def get_job_output_tail(
+        self,
+        jobid: str,
+        offsets: Optional[Tuple[int, int]] = None,
+        lines: int = 20,
+        detail: Optional[str] = None,
+    ) -> Tuple[str, str, Tuple[int, int]]:
+        """Get stdout and stderr written since a previous call, like ``tail -f``.
+
+        Args:
+            jobid: The job ID to get output for.
+            offsets: (stdout, stderr) byte offsets returned by the previous call,
+                or None to start with the last ``lines`` lines of each file.
+            lines: Number of lines to read from the end when starting over.
+            detail: Pre-fetched job detail string to avoid duplicate scontrol call.
+
+        Returns:
+            Tuple of (stdout, stderr, new_offsets). A file that shrank since the
+            previous call is read again from its last ``lines`` lines.
+        """
+        paths = await self.get_job_output_paths(jobid, detail)
+        return await self.tail_output_files(paths, offsets, lines)
+
+    async def tail_output_files(
+        self,
+        paths: Tuple[str, str],
+        offsets: Optional[Tuple[int, int]] = None,
+        lines: int = 20,
+    ) -> Tuple[str, str, Tuple[int, int]]:
+        """Like get_job_output_tail, for already known (stdout, stderr) paths."""
+        if self._mock_mode:
+            if offsets is None:
+                return "Mock stdout output for testing", "Mock stderr output for testing", (0, 0)
+            return "", "", offsets
+
+        stdout_file, stderr_file = paths
+        stdout_offset, stderr_offset = offsets if offsets is not None else (None, None)
+        (stdout, stdout_end), (stderr, stderr_end) = await asyncio.gather(
+            asyncio.to_thread(self._read_output_delta, stdout_file, stdout_offset, lines),
+            asyncio.to_thread(self._read_output_delta, stderr_file, stderr_offset, lines),
+        )
+        return stdout, stderr, (stdout_end, stderr_end)
+
+    @staticmethod
+    def _read_output_delta(filepath: str, offset: Optional[int], lines: int) -> Tuple[str, int]:
+        """Read an output file from a byte offset to its end.
+
+        Args:
+            filepath: Path to the output file.
+            offset: Byte offset to read from, or None to read the last ``lines`` lines.
+            lines: Number of lines to keep when not continuing from ``offset``.
+
+        Returns:
+            Tuple of (text, offset of the end of the file).
+        """
+        if not filepath or filepath == "/dev/null":
+            return "", 0
+        if offset is not None:
+            # Most polls find nothing new; a stat is enough to tell
+            with contextlib.suppress(OSError):
+                if os.stat(filepath).st_size == offset:
+                    return "", offset
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError as e:
+            return f"Could not read file: {e}", 0
+        try:
+            size = os.fstat(fd).st_size
+            # Start over on the first read or when the file was truncated
+            from_tail = offset is None or offset > size
+            start = max(size - SlurmClient.OUTPUT_TAIL_BYTES, 0 if offset is None or from_tail else offset)
+            os.lseek(fd, start, os.SEEK_SET)
+            chunks: List[bytes] = []
+            remaining = size - start
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        except OSError as e:
+            return f"Error reading file: {e}", 0
+        finally:
+            os.close(fd)
+
+        data = b"".join(chunks)
+        # A character still being written is left for the next poll instead of decoding as U+FFFD
+        end = SlurmClient._complete_utf8_length(data)
+        text = data[:end].decode(errors="replace")
+        if from_tail:
+            keep = lines + 1 if text.endswith("\n") else lines
+            text = "\n".join(text.split("\n")[-keep:])
+        return text, start + end
+
+    @staticmethod
+    def _complete_utf8_length(data: bytes) -> int:
+        """Length of ``data`` without a trailing, incomplete UTF-8 sequence."""
+        # A sequence is at most 4 bytes, so its lead byte is among the last 4
+        for i in range(len(data) - 1, max(len(data) - 4, 0) - 1, -1):
+            byte = data[i]
+            if byte & 0xC0 == 0x80:
+                # Continuation byte; keep looking for the lead byte
+                continue
+            if byte >= 0xF0:
+                needed = 4
+            elif byte >= 0xE0:
+                needed = 3
+            elif byte >= 0xC0:
+                needed = 2
+            else:
+                needed = 1
+            return i if i + needed > len(data) else len(data)
+        return len(data)
+
     async def _read_output_file(self, filepath: str, lines: int = 20) -> str:
         """Read content from an output file.
 
@@ -278,7 +489,8 @@ class SlurmClient:
 
     def _parse_squeue_output_line(self, line: str) -> List[str]:
         """Parse fixed-width squeue -O output line into fields."""
-        widths = [10, 12, 36, 10, 10, 50, 12, 14]
+        # Field widths of the get_jobs -O format
+        widths = [30, 12, 36, 10, 10, 50, 12, 14]
         parts = []
         pos = 0
 
@@ -300,21 +512,27 @@ class SlurmClient:
 
         return parts
 
-    def _parse_gpu_count(self, tres_field: str) -> str:
+    # The parsers below are pure and see the same few strings on every refresh,
+    # so they are memoized on the raw field value.
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_gpu_count(tres_field: str) -> str:
         """Parse GPU count from TRES field."""
         if not tres_field or tres_field == "N/A":
             return "0"
-        for pattern in self.GPU_COUNT_PATTERNS:
+        for pattern in SlurmClient.GPU_COUNT_PATTERNS:
             match = pattern.search(tres_field)
             if match:
                 return match.group(1)
         return "0"
 
-    def _parse_gpu_type(self, tres_field: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_gpu_type(tres_field: str) -> str:
         """Parse GPU type from TRES field."""
         if not tres_field or tres_field == "N/A":
             return ""
-        match = self.GPU_TYPE_PATTERN.search(tres_field)
+        match = SlurmClient.GPU_TYPE_PATTERN.search(tres_field)
         if match:
             gpu_type = match.group(1).upper()
             if "h100" in gpu_type.lower():
@@ -324,51 +542,61 @@ class SlurmClient:
             elif "v100" in gpu_type.lower():
                 return "V100"
             return gpu_type
-        if self._parse_gpu_count(tres_field) != "0":
+        if SlurmClient._parse_gpu_count(tres_field) != "0":
             return "H100"
         return ""
 
-    def parse_node_gpu_info(self, gres_field: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def parse_node_gpu_info(gres_field: str) -> str:
         """Parse GPU count from node GRES field."""
         if not gres_field or gres_field in ("(null)", "N/A"):
             return "0"
-        for pattern in self.NODE_GPU_PATTERNS:
+        for pattern in SlurmClient.NODE_GPU_PATTERNS:
             match = pattern.search(gres_field)
             if match:
                 return match.group(1)
         return "0"
 
-    def extract_cpus_from_tres(self, tres_field: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def extract_cpus_from_tres(tres_field: str) -> str:
         """Extract CPU count from TRES field."""
         if not tres_field or tres_field == "N/A":
             return ""
-        match = self.CPU_PATTERN.search(tres_field)
+        match = SlurmClient.CPU_PATTERN.search(tres_field)
         if match:
             return match.group(1)
         return ""
 
-    def extract_mem_from_tres(self, tres_field: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def extract_mem_from_tres(tres_field: str) -> str:
         """Extract memory from TRES field."""
         if not tres_field or tres_field == "N/A":
             return ""
-        match = self.MEM_PATTERN.search(tres_field)
+        match = SlurmClient.MEM_PATTERN.search(tres_field)
         if match:
             return match.group(1)
         return ""
 
-    def count_nodes_from_nodelist(self, nodelist: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def count_nodes_from_nodelist(nodelist: str) -> str:
         """Count the number of nodes from NodeList field."""
         if not nodelist or nodelist.strip() == "":
             return "0"
-        if any(reason in nodelist for reason in self.PENDING_REASONS):
+        if any(reason in nodelist for reason in SlurmClient.PENDING_REASONS):
             return "0"
         nodes = [n.strip() for n in nodelist.split(",") if n.strip()]
         return str(len(nodes))
 
-    def combine_nodelist_reason(self, nodelist: str, reason: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def combine_nodelist_reason(nodelist: str, reason: str) -> str:
         """Combine NodeList and Reason into a single display field."""
         if nodelist and nodelist.strip():
-            if not any(r in nodelist for r in self.PENDING_REASONS):
+            if not any(r in nodelist for r in SlurmClient.PENDING_REASONS):
                 return nodelist
         if reason and reason.strip() and reason != "None":
             return reason
@@ -383,6 +611,7 @@ class SlurmClient:
                 "JOBID": "12345",
                 "PARTITION": "h100",
                 "NAME": "train-resnet-50",
+                "NAME_SHORT": "train-resnet-50",
                 "USERNAME": "alice",
                 "STATE": "RUNNING",
                 "TRES": "billing=8,cpu=16,gres/gpu:h100:4,mem=64G,node=1",
@@ -390,6 +619,7 @@ class SlurmClient:
                 "TimeLimit": "24:00:00",
                 "ReqNodes": "1",
                 "NodeList": "DGX-H100-1",
+                "Reason": "",
                 "GPU_COUNT": "4",
                 "GPU_TYPE": "H100",
             },
@@ -397,6 +627,7 @@ class SlurmClient:
                 "JOBID": "12346",
                 "PARTITION": "a100",
                 "NAME": "inference-bert-large",
+                "NAME_SHORT": "inference-bert-large",
                 "USERNAME": "bob",
                 "STATE": "PENDING",
                 "TRES": "billing=2,cpu=8,gres/gpu:a100:2,mem=32G,node=1",
@@ -404,6 +635,7 @@ class SlurmClient:
                 "TimeLimit": "12:00:00",
                 "ReqNodes": "1",
                 "NodeList": "(Resources)",
+                "Reason": "",
                 "GPU_COUNT": "2",
                 "GPU_TYPE": "H100",
             },
@@ -411,6 +643,7 @@ class SlurmClient:
                 "JOBID": "12347",
                 "PARTITION": "cpu",
                 "NAME": "data-preprocessing",
+                "NAME_SHORT": "data-preprocessing",
                 "USERNAME": "charlie",
                 "STATE": "RUNNING",
                 "TRES": "billing=4,cpu=32,mem=128G,node=1",
@@ -418,6 +651,7 @@ class SlurmClient:
                 "TimeLimit": "06:00:00",
                 "ReqNodes": "1",
                 "NodeList": "DGX-H100-2",
+                "Reason": "",
                 "GPU_COUNT": "0",
                 "GPU_TYPE": "",
             },
@@ -440,6 +674,7 @@ class SlurmClient:
         ]
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def parse_time_to_seconds(time_str: str) -> int:
         """Parse Slurm time format to seconds.
 
@@ -153,4 +153,13 @@ Screen { layout: vertical; overflow: hidden; }
     width: 100%;
 }
 
+/* Cancel Confirmation Modal */
+#cancel_confirm_container {
+    background: $surface;
+    border: solid $warning;
+    padding: 1 2;
+    width: auto;
+    height: auto;
+}
+
 """
@@ -3,7 +3,9 @@
 import asyncio
 import contextlib
 import os
+import shlex
 import signal
+import time
 from typing import Optional, Tuple
 
 
@@ -16,22 +18,41 @@ def which(cmd: str) -> Optional[str]:
     return None
 
 
+# (epoch second, formatted time) of the last now_hms() call
+_hms_cache: Tuple[int, str] = (-1, "")
+
+
+def now_hms() -> str:
+    """Return the current local time as HH:MM:SS, formatting it at most once per second."""
+    global _hms_cache
+    second = int(time.time())
+    if second != _hms_cache[0]:
+        _hms_cache = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+    return _hms_cache[1]
+
+
 async def run_cmd(cmd: str, timeout: float = 10.0) -> Tuple[int, str, str]:
-    """Run a shell command asynchronously with timeout.
+    """Run a command asynchronously with timeout.
+
+    The command is split with shell quoting rules but executed directly, so each
+    poll does not pay for starting the user's shell.
 
     Args:
-        cmd: Shell command to execute
+        cmd: Command line to execute (no pipes or other shell syntax)
         timeout: Timeout in seconds
 
     Returns:
         Tuple of (return_code, stdout, stderr)
     """
-    proc = await asyncio.create_subprocess_shell(
-        cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        executable=os.environ.get("SHELL", "/bin/bash"),
-    )
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *shlex.split(cmd),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        # Same exit status a shell reports for a missing command
+        return 127, "", str(e)
     try:
         stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
     except asyncio.TimeoutError:
@@ -1,19 +1,49 @@
 """Custom widgets for smon dashboard."""
 
-from typing import Any, Dict, List, Optional
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.syntax import Syntax
+from rich.text import Text
 from textual.reactive import reactive
 from textual.widgets import Static
 
 
+def _tail_lines(text: str, max_lines: int) -> str:
+    """Return the last max_lines lines of text (text itself if it is short enough).
+
+    Scans back from the end, so a large log is not split into lines just to keep its tail.
+    """
+    pos = len(text)
+    for _ in range(max_lines):
+        pos = text.rfind("\n", 0, pos)
+        if pos < 0:
+            return text
+    return text[pos + 1 :]
+
+
 class StatusBar(Static):
     """Status bar widget displaying messages."""
 
+    # Reactive assignment already skips the watcher when the message is unchanged
     message = reactive("Ready")
 
     def watch_message(self, value: str) -> None:
-        self.update(f"[b]{value}[/b]")
+        # Plain styled text: no markup parsing, and brackets in error messages show literally
+        self.update(Text(value, style="bold"))
+
+
+class CachedSyntax(Syntax):
+    """Syntax that lexes its code once instead of on every measure and render pass."""
+
+    _lexed: Optional[Tuple[str, Any, Text]] = None
+
+    def highlight(self, code: str, line_range: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Text:
+        lexed = self._lexed
+        if lexed is None or lexed[0] != code or lexed[1] != line_range:
+            lexed = self._lexed = (code, line_range, super().highlight(code, line_range))
+        # Rich stylizes and trims the returned Text while rendering
+        return lexed[2].copy()
 
 
 class SyntaxViewer(Static):
@@ -40,7 +70,7 @@ class SyntaxViewer(Static):
             # Use theme based on app's dark mode
             is_dark = self.app.theme == "textual-dark" if hasattr(self.app, "theme") else True
             theme = "monokai" if is_dark else "github-light"
-            syntax = Syntax(self._code, self._language, theme=theme, line_numbers=True)
+            syntax = CachedSyntax(self._code, self._language, theme=theme, line_numbers=True)
             self.update(syntax)
         except Exception:
             self.update(f"```{self._language}\n{self._code}\n```")
@@ -58,30 +88,37 @@ class LogViewer(Static):
         super().__init__(*args, **kwargs)
         self._content = ""
         self._max_lines = 1000
+        # (length, tail) of the last text passed to set_content
+        self._signature: Optional[Tuple[int, str]] = None
 
     def append_content(self, content: str) -> None:
         """Append new content to the log viewer."""
         if content:
             self._content += content
-            lines = self._content.split("\n")
-            if len(lines) > self._max_lines:
-                lines = lines[-self._max_lines :]
-                self._content = "\n".join(lines)
+            tail = _tail_lines(self._content, self._max_lines)
+            if tail is not self._content:
+                self._content = tail
+                self._signature = None
+            else:
+                # The shown text is still the full output, so set_content can match against it
+                self._signature = (len(self._content), self._content[-4096:])
             self.update(self._content)
             self.scroll_end()
 
     def set_content(self, content: str) -> None:
-        """Set the entire content of the log viewer."""
-        self._content = content
-        lines = content.split("\n")
-        if len(lines) > self._max_lines:
-            lines = lines[-self._max_lines :]
-            self._content = "\n".join(lines)
+        """Set the entire content of the log viewer, skipping the re-render if it is unchanged."""
+        # Logs only grow or get rewritten at the end, so length + tail is enough to detect a change
+        signature = (len(content), content[-4096:])
+        if signature == self._signature:
+            return
+        self._signature = signature
+        self._content = _tail_lines(content, self._max_lines)
         self.update(self._content)
         self.scroll_end()
 
     def clear(self) -> None:
         """Clear the log viewer content."""
+        self._signature = None
         self._content = ""
         self.update("")
 
@@ -109,6 +146,12 @@ class GpustatViewer(Static):
         self.update(self._content)
 
 
+def _search_text(row: Dict[str, Any]) -> str:
+    """Lowercased concatenation of all row values for free-text search."""
+    # NUL separator so a search can't match across two adjacent fields
+    return "\0".join(map(str, row.values())).lower()
+
+
 class Filter:
     """Filter for jobs and nodes data."""
 
@@ -117,29 +160,51 @@ class Filter:
         self.user: Optional[str] = None
         self.partition: Optional[str] = None
         self.state: Optional[str] = None
+        # kind -> (row list, search text of each row), reused while the same list is re-filtered
+        self._search_index: Dict[str, Tuple[List[Dict[str, Any]], List[str]]] = {}
+
+    def _search_texts(self, kind: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """Search text of each row, built once per row list."""
+        indexed = self._search_index.get(kind)
+        if indexed is None or indexed[0] is not rows:
+            indexed = (rows, [_search_text(r) for r in rows])
+            self._search_index[kind] = indexed
+        return indexed[1]
+
+    def _normalized(self) -> Tuple[str, str, str, str]:
+        """Return lowercased (user, partition, state, text) filter values."""
+        return (
+            (self.user or "").lower(),
+            (self.partition or "").lower(),
+            (self.state or "").lower(),
+            self.text.lower(),
+        )
 
     def apply_jobs(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply filter to jobs list."""
-        res = rows
-        if self.user:
-            res = [r for r in res if (r.get("USERNAME", "") or r.get("USER", "")).lower() == self.user.lower()]
-        if self.partition:
-            res = [r for r in res if self.partition.lower() in r.get("PARTITION", "").lower()]
-        if self.state:
-            res = [r for r in res if self.state.lower() in r.get("STATE", "").lower()]
-        if self.text:
-            pat = self.text.lower()
-            res = [r for r in res if any(pat in str(v).lower() for v in r.values())]
-        return res
+        user, partition, state, text = self._normalized()
+        if not (user or partition or state or text):
+            return rows
+        searches = self._search_texts("jobs", rows) if text else itertools.repeat("")
+        return [
+            r
+            for r, search in zip(rows, searches)
+            if (not user or (r.get("USERNAME", "") or r.get("USER", "")).lower() == user)
+            and (not partition or partition in r.get("PARTITION", "").lower())
+            and (not state or state in r.get("STATE", "").lower())
+            and (not text or text in search)
+        ]
 
     def apply_nodes(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply filter to nodes list."""
-        res = rows
-        if self.partition:
-            res = [r for r in res if self.partition.lower() in r.get("PARTITION", "").lower()]
-        if self.state:
-            res = [r for r in res if self.state.lower() in r.get("STATE", "").lower()]
-        if self.text:
-            pat = self.text.lower()
-            res = [r for r in res if any(pat in str(v).lower() for v in r.values())]
-        return res
+        _, partition, state, text = self._normalized()
+        if not (partition or state or text):
+            return rows
+        searches = self._search_texts("nodes", rows) if text else itertools.repeat("")
+        return [
+            r
+            for r, search in zip(rows, searches)
+            if (not partition or partition in r.get("PARTITION", "").lower())
+            and (not state or state in r.get("STATE", "").lower())
+            and (not text or text in search)
+        ]
@@ -0,0 +1,503 @@
+"""Tests for smon.app module."""
+
+import asyncio
+
+import pytest
+from rich.text import Text
+from textual.widgets import DataTable, Input
+
+from smon.app import SlurmDashboard
+
+
+class TestPopulateJobs:
+    """Tests for incremental jobs table updates."""
+
+    async def test_rows_keyed_by_jobid(self) -> None:
+        """Test that job rows are keyed by JOBID."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            table = app.query_one("#jobs_table", DataTable)
+            assert [row.key.value for row in table.ordered_rows] == ["12345", "12346", "12347"]
+
+    async def test_diff_update(self) -> None:
+        """Test that refreshes update, remove and reorder rows in place."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            table = app.query_one("#jobs_table", DataTable)
+            jobs = app.client._mock_jobs()
+            jobs[0]["STATE"] = "COMPLETED"
+            await app._populate_jobs([jobs[2], jobs[0]])
+            assert [row.key.value for row in table.ordered_rows] == ["12347", "12345"]
+            assert table.get_row("12345")[2].plain == "COMPLETED"
+            assert set(app._jobs_cache) == {"12345", "12347"}
+
+    async def test_cursor_follows_selected_job(self) -> None:
+        """Test that the cursor stays on the same job when rows reorder."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            table = app.query_one("#jobs_table", DataTable)
+            table.move_cursor(row=2)
+            jobs = app.client._mock_jobs()
+            await app._populate_jobs([jobs[2], jobs[0], jobs[1]])
+            assert table.cursor_coordinate.row == 0
+            assert table.get_row_at(0)[0] == "12347"
+
+    async def test_empty_table_refresh(self) -> None:
+        """Test that emptying and refilling the table keeps a valid cursor."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            table = app.query_one("#jobs_table", DataTable)
+            await app._populate_jobs([])
+            assert table.row_count == 0
+            await app._populate_jobs(app.client._mock_jobs())
+            assert table.cursor_coordinate.row == 0
+
+    async def test_refresh_resorts_on_sort_column_change(self, monkeypatch) -> None:
+        """Test that only changes to the sorted column re-sort the table."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            app._sort_column = "MEM"
+            sorts: list[bool] = []
+            monkeypatch.setattr(app, "_apply_current_sort", lambda: sorts.append(True))
+            jobs = app.client._mock_jobs()
+            await app._populate_jobs(jobs)
+            assert sorts == []
+            jobs[0]["STATE"] = "COMPLETED"
+            await app._populate_jobs(jobs)
+            assert sorts == []
+            jobs[0]["TRES"] = "cpu=4,mem=1T,gres/gpu=1"
+            await app._populate_jobs(jobs)
+            assert sorts == [True]
+
+    async def test_identical_poll_skips_sync(self, monkeypatch) -> None:
+        """Test that an unchanged squeue result does not rebuild the table rows."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            monkeypatch.setattr(app, "_build_job_rows", lambda jobs: pytest.fail("rows rebuilt"))
+            await app.refresh_data(nodes=False)
+
+    def test_basic_layout_rows(self) -> None:
+        """Test that jobs from the basic squeue format use the basic column layout."""
+        app = SlurmDashboard(mock_mode=True)
+        job = {
+            "JOBID": "1",
+            "USER": "alice",
+            "STATE": "PENDING",
+            "PARTITION": "gpu",
+            "CPUS": "8",
+            "MEM": "32G",
+            "TIME": "0:00",
+            "NAME_SHORT": "train",
+            "NODELIST(REASON)": "(Resources)",
+        }
+        columns, rows = app._build_job_rows([job])
+        assert columns[-1] == "NODELIST(REASON)"
+        assert rows["1"][-2:] == ("0", "(Resources)")
+
+    def test_repeated_jobid_keeps_both_rows(self) -> None:
+        """Test that a job id listed twice adds a second row instead of replacing the first."""
+        app = SlurmDashboard(mock_mode=True)
+        jobs = app.client._mock_jobs()
+        jobs[1]["JOBID"] = jobs[0]["JOBID"]
+        _columns, rows = app._build_job_rows(jobs)
+        assert list(rows) == ["12345", "12345#2", "12347"]
+        assert rows["12345#2"][0] == "12345"
+
+
+class TestAdaptiveRefresh:
+    """Tests for the adaptive refresh interval."""
+
+    def test_backoff_when_idle(self) -> None:
+        """Test that the interval grows while nothing changes and resets on change."""
+        app = SlurmDashboard(refresh_sec=5.0, mock_mode=True)
+        jobs = app.client._mock_jobs()
+        app._update_dynamic_interval(jobs)
+        assert app._dynamic_interval == 5.0
+        app._update_dynamic_interval(jobs)
+        assert app._dynamic_interval == 7.5
+        for _ in range(20):
+            app._update_dynamic_interval(jobs)
+        assert app._dynamic_interval == 60.0
+
+        jobs[0]["STATE"] = "COMPLETED"
+        app._update_dynamic_interval(jobs)
+        assert app._dynamic_interval == 5.0
+
+
+class TestRefreshScheduling:
+    """Tests for skipping timer ticks while a refresh is in flight."""
+
+    async def test_skip_while_refresh_in_flight(self) -> None:
+        """Test that no refresh worker is started while one is still running."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            async with app._jobs_lock:
+                app._schedule_refresh()
+                assert not [w for w in app.workers if w.group == "refresh_jobs"]
+            app._schedule_refresh()
+            assert [w for w in app.workers if w.group == "refresh_jobs"]
+
+    async def test_skipped_tick_rearms_timer(self, monkeypatch) -> None:
+        """Test that a tick skipped while the jobs lock is held keeps polling alive."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            armed: list[float] = []
+            monkeypatch.setattr(app, "_arm_refresh_timer", lambda elapsed=0.0: armed.append(elapsed))
+            async with app._jobs_lock:
+                app._schedule_refresh()
+            assert armed == [0.0]
+
+    def test_poll_interval_includes_poll_time(self, monkeypatch) -> None:
+        """Test that the next poll is timed from the start of the previous one."""
+        app = SlurmDashboard(refresh_sec=5.0, mock_mode=True)
+        delays: list[float] = []
+        monkeypatch.setattr(app, "set_timer", lambda delay, callback: delays.append(delay))
+        app._arm_refresh_timer(2.0)
+        app._arm_refresh_timer(30.0)
+        assert delays == [3.0, 1.0]
+
+    async def test_nodes_refresh_waits_for_tab(self, monkeypatch) -> None:
+        """Test that timed node refreshes are skipped until the Nodes tab is shown."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test() as pilot:
+            calls: list[bool] = []
+
+            async def refresh_data(quiet: bool = False, jobs: bool = True, nodes: bool = True) -> None:
+                calls.append(nodes)
+
+            monkeypatch.setattr(app, "refresh_data", refresh_data)
+            app._schedule_nodes_refresh()
+            await pilot.pause()
+            assert calls == []
+
+            app._nodes_refreshed_at = 0.0
+            app._tabs.active = "tab_nodes"
+            await pilot.pause()
+            assert calls == [True]
+
+    async def test_nodes_fetched_when_tab_shown(self) -> None:
+        """Test that sinfo is not run until the Nodes tab is first shown."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test() as pilot:
+            assert app._raw_nodes is None
+            app._tabs.active = "tab_nodes"
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            assert app._nodes_cache
+
+    async def test_status_node_count(self) -> None:
+        """Test that the status line omits the node count until nodes load and marks it stale off-tab."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            assert "Nodes:" not in str(app.status.message)
+
+            app._tabs.active = "tab_nodes"
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await app.refresh_data(quiet=True)
+            assert f"Nodes: {len(app._nodes_cache)} |" in str(app.status.message)
+
+            app._tabs.active = "tab_jobs"
+            await pilot.pause()
+            await app.refresh_data(quiet=True)
+            assert f"Nodes: {len(app._nodes_cache)} (stale)" in str(app.status.message)
+
+
+class TestFilterDebounce:
+    """Tests for coalescing filter changes."""
+
+    async def test_burst_triggers_one_refresh(self, monkeypatch) -> None:
+        """Test that several quick filter changes refresh the tables once."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test() as pilot:
+            calls: list[str] = []
+
+            async def refresh_data(
+                quiet: bool = False, jobs: bool = True, nodes: bool = True, fetch: bool = True
+            ) -> None:
+                calls.append(app.filter.text)
+
+            monkeypatch.setattr(app, "refresh_data", refresh_data)
+            for text in ("a", "al", "alice"):
+                app.filter.text = text
+                app._schedule_filter_refresh()
+            await pilot.pause(0.4)
+            assert calls == ["alice"]
+
+    async def test_filter_reuses_last_results(self, monkeypatch) -> None:
+        """Test that a filter change re-filters the last results without querying Slurm."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+
+            async def fail() -> None:
+                pytest.fail("Slurm queried")
+
+            monkeypatch.setattr(app.client, "get_jobs", fail)
+            monkeypatch.setattr(app.client, "get_nodes", fail)
+            app.filter.text = "12345"
+            await app.refresh_data(fetch=False)
+            assert list(app._jobs_cache) == ["12345"]
+
+    async def test_unchanged_search_skipped(self, monkeypatch) -> None:
+        """Test that submitting the current search text does not schedule a refresh."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            search = app.query_one("#job_search", Input)
+            app.filter.text = "alice"
+            monkeypatch.setattr(app, "_schedule_filter_refresh", lambda: pytest.fail("refresh scheduled"))
+            app.on_input_submitted(Input.Submitted(search, " alice "))
+
+    async def test_tick_during_filter_resync_keeps_polling(self, monkeypatch) -> None:
+        """Test that timed polls resume when a tick lands while a re-filter holds the jobs lock."""
+        monkeypatch.setattr("smon.app._MIN_REFRESH_GAP", 0.05)
+        app = SlurmDashboard(refresh_sec=0.1, mock_mode=True)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app._dynamic_interval = 0.1
+            resync_started = asyncio.Event()
+            finish_resync = asyncio.Event()
+            refresh_jobs = app._refresh_jobs
+
+            async def slow_refresh_jobs(fetch: bool = True) -> None:
+                if fetch:
+                    return await refresh_jobs(fetch)
+                async with app._jobs_lock:
+                    resync_started.set()
+                    await finish_resync.wait()
+
+            polls = []
+            get_jobs = app.client.get_jobs
+
+            async def counting_get_jobs():
+                polls.append(True)
+                return await get_jobs()
+
+            monkeypatch.setattr(app, "_refresh_jobs", slow_refresh_jobs)
+            monkeypatch.setattr(app.client, "get_jobs", counting_get_jobs)
+            resync = asyncio.create_task(app.refresh_data(fetch=False))
+            await resync_started.wait()
+            # The pending tick fires while the re-sync holds the lock
+            app._refresh_timer.stop()
+            app._schedule_refresh()
+            finish_resync.set()
+            await resync
+            await pilot.pause(0.3)
+            assert polls
+
+
+class TestCancelJob:
+    """Tests for the job cancel confirmation."""
+
+    async def test_other_key_aborts(self, monkeypatch) -> None:
+        """Test that any key other than 'c' dismisses the confirmation without cancelling."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test() as pilot:
+            cancelled: list[str] = []
+
+            async def cancel_job(jobid: str) -> tuple[bool, str]:
+                cancelled.append(jobid)
+                return True, "cancelled"
+
+            monkeypatch.setattr(app.client, "cancel_job", cancel_job)
+            await pilot.press("c", "x")
+            await pilot.pause()
+            assert cancelled == []
+            assert app.status.message == "Cancellation aborted"
+            await pilot.press("c", "c")
+            await pilot.pause()
+            assert cancelled == ["12345"]
+
+
+class TestPageFiles:
+    """Tests for streaming output files into the pager."""
+
+    def test_missing_pager_reported(self, tmp_path) -> None:
+        """Test that a pager that cannot be started is reported instead of ignored."""
+        log = tmp_path / "out.log"
+        log.write_text("line\n")
+        error = SlurmDashboard._page_files([str(tmp_path / "no-pager")], [str(log)])
+        assert error is not None and "no-pager" in error
+
+    def test_unreadable_file_reported(self, tmp_path) -> None:
+        """Test that an output file removed before paging is reported."""
+        missing = tmp_path / "gone.log"
+        error = SlurmDashboard._page_files(["cat"], [str(missing)])
+        assert error is not None and "gone.log" in error
+
+
+class TestJobBindings:
+    """Tests for the key bindings that act on the selected job."""
+
+    async def test_job_keys_after_tab_switch(self, monkeypatch) -> None:
+        """Test that job keys work on the Jobs tab whatever has focus, and do nothing on the Nodes tab."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            copied: list[bool] = []
+            monkeypatch.setattr(app, "action_copy_jobid", lambda: copied.append(True))
+
+            await pilot.press("2")
+            await pilot.press("y")
+            assert copied == []
+
+            await pilot.press("1")
+            await pilot.press("y")
+            assert copied == [True]
+
+
+class TestParseGpuCount:
+    """Tests for GRES GPU count parsing."""
+
+    def test_gres_formats(self) -> None:
+        """Test counts for the GRES formats reported by sinfo."""
+        app = SlurmDashboard(mock_mode=True)
+        assert app._parse_gpu_count("gpu:h100:8") == 8
+        assert app._parse_gpu_count("gpu:8") == 8
+        assert app._parse_gpu_count("gpu:8(S:0-1)") == 8
+        assert app._parse_gpu_count("gpu:4(IDX:2-3)") == 4
+        assert app._parse_gpu_count("gpu:h100:4(S:0-1)") == 4
+        assert app._parse_gpu_count("gpu:(null):8(IDX:0-7)") == 8
+        assert app._parse_gpu_count("gpu:h100:0(IDX:N/A)") == 0
+        assert app._parse_gpu_count("(null)") == 0
+
+    def test_ignores_other_gres(self) -> None:
+        """Test that non-GPU GRES entries are not counted and GPU entries are summed."""
+        app = SlurmDashboard(mock_mode=True)
+        assert app._parse_gpu_count("gpu:h100:8,mps:400") == 8
+        assert app._parse_gpu_count("gpu:a100:4(S:0),gpu:v100:2(S:1)") == 6
+
+
+class TestSortKey:
+    """Tests for column sort keys."""
+
+    def test_numeric_columns(self) -> None:
+        """Test that memory and integer columns sort by value, not text."""
+        mem = SlurmDashboard._sort_key("MEM")
+        assert sorted(["4G", "512M", "1T", "-"], key=mem) == ["512M", "4G", "1T", "-"]
+        assert sorted(["4000", "1G"], key=mem) == ["1G", "4000"]
+        assert sorted(["2g", "1.5G", "N/A"], key=mem) == ["1.5G", "2g", "N/A"]
+        cpus = SlurmDashboard._sort_key("CPUS")
+        assert sorted([Text("16"), Text("8")], key=cpus) == [Text("8"), Text("16")]
+
+    async def test_toggle_reverses_order(self) -> None:
+        """Test that re-selecting the sorted column reverses the row order."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            table = app.query_one("#jobs_table", DataTable)
+            column_key = table.columns["MEM"].key
+            event = DataTable.HeaderSelected(table, column_key, 5, Text("MEM"))
+            app.on_data_table_header_selected(event)
+            order = [row.key.value for row in table.ordered_rows]
+            app.on_data_table_header_selected(event)
+            assert [row.key.value for row in table.ordered_rows] == order[::-1]
+            assert app._sort_reverse is False
+
+    async def test_toggle_reverses_repeated_jobids(self) -> None:
+        """Test that reversing flips rows that share a job id or sort value exactly."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            table = app.query_one("#jobs_table", DataTable)
+            jobs = app.client._mock_jobs()
+            jobs[1]["JOBID"] = jobs[0]["JOBID"]
+            jobs[1]["USERNAME"] = jobs[0]["USERNAME"]
+            await app._populate_jobs(jobs)
+            column_key = table.columns["USERNAME"].key
+            event = DataTable.HeaderSelected(table, column_key, 1, Text("USERNAME"))
+            app.on_data_table_header_selected(event)
+            order = [row.key.value for row in table.ordered_rows]
+            app.on_data_table_header_selected(event)
+            assert [row.key.value for row in table.ordered_rows] == order[::-1]
+
+
+class TestJobStatePoll:
+    """Tests for the per-job state poll used by real-time output."""
+
+    async def test_failed_poll_keeps_states(self, monkeypatch) -> None:
+        """Test that a failed squeue call does not mark active jobs as finished."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            await app.workers.wait_for_complete()
+            await app._refresh_job_states()
+            states = dict(app._state_cache)
+            assert states["12345"] == "RUNNING"
+
+            async def get_job_states(jobids):
+                return None
+
+            monkeypatch.setattr(app.client, "get_job_states", get_job_states)
+            await app._refresh_job_states()
+            assert app._state_cache == states
+
+    async def test_repeated_jobid_polled_once(self, monkeypatch) -> None:
+        """Test that squeue is asked for job ids, not the row keys of repeated ids."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            await app.workers.wait_for_complete()
+            jobs = app.client._mock_jobs()
+            jobs[1]["JOBID"] = jobs[0]["JOBID"]
+            jobs[1]["STATE"] = jobs[0]["STATE"]
+            await app._populate_jobs(jobs)
+            polled = []
+
+            async def get_job_states(jobids):
+                polled.append(jobids)
+                return {}
+
+            monkeypatch.setattr(app.client, "get_job_states", get_job_states)
+            await app._refresh_job_states()
+            assert polled == [["12345", "12347"]]
+
+    async def test_rows_removed_during_poll(self, monkeypatch) -> None:
+        """Test that jobs dropped from the table while squeue ran are skipped."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            await app.workers.wait_for_complete()
+
+            async def get_job_states(jobids):
+                app._jobs_cache.pop("12345")
+                return {}
+
+            monkeypatch.setattr(app.client, "get_job_states", get_job_states)
+            await app._refresh_job_states()
+            assert app._state_cache["12345"] == "COMPLETED"
+
+
+class TestJobDetailCache:
+    """Tests for the job detail/script cache."""
+
+    async def test_cached_detail_reused(self) -> None:
+        """Test that a freshly loaded job detail is served from the cache."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            app.current_jobid = "12345"
+            await app._load_job_details("12345", can_refresh=True)
+            detail, script_text = app._cached_job_detail("12345")
+            assert "12345" in detail
+            assert "mock_job_12345" in script_text
+
+    async def test_reselect_skips_reload(self, monkeypatch) -> None:
+        """Test that selecting the shown job again only refreshes its output."""
+        app = SlurmDashboard(mock_mode=True)
+        async with app.run_test():
+            table = app.query_one("#jobs_table", DataTable)
+            event = DataTable.RowSelected(table, 0, table.coordinate_to_cell_key((0, 0)).row_key)
+            await app.on_data_table_row_selected(event)
+            await app.workers.wait_for_complete()
+            assert app._output_paths is not None
+
+            loads: list[str] = []
+
+            async def load_job_details(jobid: str, can_refresh: bool) -> None:
+                loads.append(jobid)
+
+            monkeypatch.setattr(app, "_load_job_details", load_job_details)
+            await app.on_data_table_row_selected(event)
+            await app.workers.wait_for_complete()
+            assert loads == []
+
+    def test_expired_detail_for_active_job(self) -> None:
+        """Test that cached detail of a job without a known finished state expires."""
+        app = SlurmDashboard(mock_mode=True)
+        app._detail_cache["1"] = ("detail", "script", 0.0)
+        assert app._cached_job_detail("1") is None
@@ -72,3 +72,27 @@ class TestConfig:
             # Should return default values
             assert config.refresh_sec == 5.0
             assert config.theme == "dark"
+
+    def test_load_reuses_parsed_file(self, tmp_path: Path) -> None:
+        """Test that an unchanged file is parsed once and an edited file again."""
+        config_file = tmp_path / "smon" / "config.json"
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        config_file.write_text('{"theme": "light"}')
+
+        with patch.object(Config, "config_path", return_value=config_file):
+            first = Config.load()
+            with patch("builtins.open", side_effect=AssertionError("file re-read")):
+                second = Config.load()
+            assert first == second
+            assert first is not second
+
+            config_file.write_text('{"theme": "light", "refresh_sec": 2.0}')
+            assert Config.load().refresh_sec == 2.0
+
+    def test_config_path_follows_xdg(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that the config path honours $XDG_CONFIG_HOME and falls back to ~/.config."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        assert Config.config_path() == tmp_path / "smon" / "config.json"
+
+        monkeypatch.setenv("XDG_CONFIG_HOME", "")
+        assert Config.config_path() == Path.home() / ".config" / "smon" / "config.json"
@@ -0,0 +1,93 @@
+"""Tests for smon.gpustat_client module."""
+
+import asyncio
+
+from smon.gpustat_client import GpustatClient
+
+
+class TestParseHtmlToText:
+    """Tests for converting gpustat-web HTML frames to Rich markup."""
+
+    def setup_method(self) -> None:
+        """Create a client for each test."""
+        self.client = GpustatClient("http://localhost:48109/")
+
+    def test_extracts_pre_content(self) -> None:
+        """Test that only the content of the first pre block is kept."""
+        html = "<html><body><h1>Title</h1><pre>\n\ngpu0  ok  \n\n</pre><p>footer</p></body></html>"
+        assert self.client._parse_html_to_text(html) == "gpu0  ok"
+
+    def test_drops_script_and_style(self) -> None:
+        """Test that script and style blocks are removed with their content."""
+        html = "<style>pre { color: red; }</style><SCRIPT>var a = '<pre>x</pre>';</SCRIPT><pre>node1</pre>"
+        assert self.client._parse_html_to_text(html) == "node1"
+
+    def test_ansi_spans_become_markup(self) -> None:
+        """Test that ANSI span classes map to Rich styles."""
+        html = '<pre><span class="ansi1 ansi32">OK</span> <span class="other">plain</span></pre>'
+        assert self.client._parse_html_to_text(html) == "[green bold]OK[/green bold] plain"
+
+    def test_unescapes_entities(self) -> None:
+        """Test that HTML entities are decoded after tags are removed."""
+        html = "<pre>a &lt;b&gt; &amp; c&#39;s</pre>"
+        assert self.client._parse_html_to_text(html) == "a <b> & c's"
+
+    def test_without_pre_keeps_all_text(self) -> None:
+        """Test that frames without a pre block keep all text content."""
+        html = "<div>line1</div>\n<div>line2   </div>\n"
+        assert self.client._parse_html_to_text(html) == "line1\nline2"
+
+    def test_plain_text_passes_through(self) -> None:
+        """Test that text without any tags is returned unchanged."""
+        assert self.client._parse_html_to_text("a < b\n") == "a < b"
+
+    def test_tags_inside_span_are_dropped(self) -> None:
+        """Test that tags nested in a styled span do not leak into the markup."""
+        html = '<pre><span class="ansi33"><b>1234</b></span> MB</pre>'
+        assert self.client._parse_html_to_text(html) == "[yellow]1234[/yellow] MB"
+
+    def test_plain_text_entities_are_unescaped(self) -> None:
+        """Test that entities are decoded even when the frame has no tags."""
+        assert self.client._parse_html_to_text("GPU &amp; CPU") == "GPU & CPU"
+
+    def test_ansi_style_lookup(self) -> None:
+        """Test the class attribute to Rich style mapping."""
+        assert GpustatClient._ansi_markup("ansi32 ansi1") == ("[green bold]", "[/green bold]")
+        assert GpustatClient._ansi_markup("ansi36") == ("[cyan]", "[/cyan]")
+        assert GpustatClient._ansi_markup("highlight") == ("", "")
+        assert GpustatClient._ansi_markup("ansi-fg") == ("", "")
+
+
+class TestParseFrame:
+    """Tests for skipping repeated gpustat-web frames."""
+
+    async def test_repeated_frame_is_skipped(self) -> None:
+        """Test that an identical frame is not parsed or passed on again."""
+        client = GpustatClient("http://localhost:48109/")
+        frame = b'<pre><span class="ansi32">0 %</span></pre>'
+        assert await client._parse_frame(frame) == "[green]0 %[/green]"
+        assert await client._parse_frame(frame) is None
+        assert await client._parse_frame(b"<pre>1 %</pre>") == "1 %"
+        assert await client._parse_frame(frame) == "[green]0 %[/green]"
+
+    async def test_large_frame_parsed_in_thread(self) -> None:
+        """Test that large frames give the same result when parsed off the event loop."""
+        client = GpustatClient("http://localhost:48109/")
+        frame = b"<pre>" + b"gpu0  ok\n" * 1000 + b"</pre>"
+        assert await client._parse_frame(frame) == "\n".join(["gpu0  ok"] * 1000)
+
+
+class TestConnect:
+    """Tests for the gpustat-web connection loop."""
+
+    async def test_disconnect_interrupts_retry_backoff(self) -> None:
+        """Test that disconnect() ends connect() without waiting out the backoff."""
+        client = GpustatClient("http://127.0.0.1:1/")
+        messages = []
+        task = asyncio.create_task(client.connect(messages.append))
+        while not messages:
+            await asyncio.sleep(0.01)
+        assert "Connection error" in messages[0]
+
+        await client.disconnect()
+        await asyncio.wait_for(task, timeout=0.5)
@@ -1,5 +1,7 @@
 """Tests for smon.slurm_client module."""
 
+import asyncio
+
 import pytest
 
 from smon.slurm_client import SlurmClient, SlurmCommands
@@ -43,6 +45,197 @@ class TestSlurmClientMockMode:
             SlurmClient(cmds=cmds, mock_mode=False)
 
 
+class TestSlurmClientJobStates:
+    """Tests for batched job state queries."""
+
+    async def test_get_job_states_mock(self, slurm_client: SlurmClient) -> None:
+        """Test that only requested jobs still in the queue are returned."""
+        states = await slurm_client.get_job_states(["12345", "12346", "99999"])
+        assert states == {"12345": "RUNNING", "12346": "PENDING"}
+
+    async def test_get_job_states_empty(self, slurm_client: SlurmClient) -> None:
+        """Test that no squeue call is needed for an empty id list."""
+        assert await slurm_client.get_job_states([]) == {}
+
+    async def test_unsupported_options_tried_once(self, slurm_client: SlurmClient, monkeypatch) -> None:
+        """Test that squeue options the cluster rejected are not retried on every poll."""
+        calls: list[str] = []
+
+        async def run_cmd(cmd: str, timeout: float) -> tuple[int, str, str]:
+            calls.append(cmd)
+            if " -O " in cmd or "--only-job-state" in cmd:
+                return 1, "", "squeue: invalid option"
+            return 0, "", ""
+
+        slurm_client._mock_mode = False
+        monkeypatch.setattr("smon.slurm_client.run_cmd", run_cmd)
+        await slurm_client.get_jobs()
+        await slurm_client.get_jobs()
+        assert sum(" -O " in cmd for cmd in calls) == 1
+        assert len(calls) == 3
+
+        calls.clear()
+        await slurm_client.get_job_states(["1"])
+        await slurm_client.get_job_states(["1"])
+        assert sum("--only-job-state" in cmd for cmd in calls) == 1
+        assert len(calls) == 3
+
+    async def test_timeout_keeps_tres_format(self, slurm_client: SlurmClient, monkeypatch) -> None:
+        """Test that one -O timeout falls back for that poll only and -O is used again next poll."""
+        calls: list[str] = []
+
+        async def run_cmd(cmd: str, timeout: float) -> tuple[int, str, str]:
+            calls.append(cmd)
+            if " -O " in cmd and len(calls) == 1:
+                return 124, "", f"Timeout after {timeout}s for: {cmd}"
+            return 0, "", ""
+
+        slurm_client._mock_mode = False
+        monkeypatch.setattr("smon.slurm_client.run_cmd", run_cmd)
+        await slurm_client.get_jobs()
+        await slurm_client.get_jobs()
+        assert [" -O " in cmd for cmd in calls] == [True, False, True]
+
+    async def test_failed_poll_returns_none(self, slurm_client: SlurmClient, monkeypatch) -> None:
+        """Test that a failing squeue is reported as None and does not drop --only-job-state."""
+        calls: list[str] = []
+
+        async def run_cmd(cmd: str, timeout: float) -> tuple[int, str, str]:
+            calls.append(cmd)
+            return 1, "", "squeue: error: Socket timed out on send/recv operation"
+
+        slurm_client._mock_mode = False
+        monkeypatch.setattr("smon.slurm_client.run_cmd", run_cmd)
+        assert await slurm_client.get_job_states(["1"]) is None
+        assert await slurm_client.get_job_states(["1"]) is None
+        assert sum("--only-job-state" in cmd for cmd in calls) == 2
+
+
+class TestSlurmClientJobList:
+    """Tests for parsing the squeue job list."""
+
+    async def test_long_array_ids_not_truncated(self, slurm_client: SlurmClient, monkeypatch) -> None:
+        """Test that array task ids longer than ten characters keep their full id."""
+        widths = [30, 12, 36, 10, 10, 50, 12, 14]
+        lines = []
+        for jobid in ("1234567_10", "1234567_11"):
+            fields = [jobid, "gpu", "train", "alice", "RUNNING", "cpu=8,mem=32G", "1:00", "1-00:00:00"]
+            lines.append("".join(f.ljust(w) for f, w in zip(fields, widths)) + "1 node1 None")
+
+        async def run_cmd(cmd: str, timeout: float) -> tuple[int, str, str]:
+            return 0, "\n".join(lines), ""
+
+        slurm_client._mock_mode = False
+        monkeypatch.setattr("smon.slurm_client.run_cmd", run_cmd)
+        jobs = await slurm_client.get_jobs()
+        assert [j["JOBID"] for j in jobs] == ["1234567_10", "1234567_11"]
+        assert jobs[0]["NodeList"] == "node1"
+
+
+class TestSlurmClientJobDetail:
+    """Tests for job detail queries."""
+
+    async def test_concurrent_calls_share_scontrol(self, slurm_client: SlurmClient, monkeypatch) -> None:
+        """Test that concurrent detail requests for one job run scontrol once."""
+        calls: list[str] = []
+
+        async def fetch(jobid: str) -> str:
+            calls.append(jobid)
+            await asyncio.sleep(0)
+            return f"JobId={jobid}"
+
+        slurm_client._mock_mode = False
+        monkeypatch.setattr(slurm_client, "_fetch_job_detail", fetch)
+        results = await asyncio.gather(slurm_client.get_job_detail("1"), slurm_client.get_job_detail("1"))
+        assert results == ["JobId=1", "JobId=1"]
+        assert calls == ["1"]
+        assert not slurm_client._detail_requests
+
+
+class TestSlurmClientJobScript:
+    """Tests for job script queries."""
+
+    async def test_script_fetched_once(self, slurm_client: SlurmClient, monkeypatch) -> None:
+        """Test that a job's script is read from the controller only once."""
+        calls: list[str] = []
+
+        async def run_cmd(cmd: str, timeout: float) -> tuple[int, str, str]:
+            calls.append(cmd)
+            return (0, "#!/bin/bash\necho hi\n", "") if " 1 " in cmd else (1, "", "Invalid job id")
+
+        slurm_client._mock_mode = False
+        monkeypatch.setattr("smon.slurm_client.run_cmd", run_cmd)
+        assert await slurm_client.get_job_script("1") == "#!/bin/bash\necho hi"
+        assert await slurm_client.get_job_script("1") == "#!/bin/bash\necho hi"
+        assert len(calls) == 1
+
+        # Failures are not cached
+        assert await slurm_client.get_job_script("2") == "(No script stored by controller)"
+        assert await slurm_client.get_job_script("2") == "(No script stored by controller)"
+        assert len(calls) == 3
+
+
+class TestSlurmClientOutputTail:
+    """Tests for incremental output file reads."""
+
+    def test_read_last_lines(self, tmp_path) -> None:
+        """Test that the first read returns the last lines and the file size."""
+        path = tmp_path / "out.txt"
+        path.write_text("a\nb\nc\n")
+        assert SlurmClient._read_output_delta(str(path), None, 2) == ("b\nc\n", 6)
+
+    def test_read_appended_bytes(self, tmp_path) -> None:
+        """Test that later reads only return what was appended."""
+        path = tmp_path / "out.txt"
+        path.write_text("a\nb\n")
+        with path.open("a") as f:
+            f.write("c\n")
+        assert SlurmClient._read_output_delta(str(path), 4, 20) == ("c\n", 6)
+        assert SlurmClient._read_output_delta(str(path), 6, 20) == ("", 6)
+
+    def test_read_split_character(self, tmp_path) -> None:
+        """Test that a UTF-8 character split between two polls is decoded whole on the second one."""
+        path = tmp_path / "out.txt"
+        bar = "progress ██".encode()
+        block = "█".encode()
+        path.write_bytes(bar + block[:1])
+        text, offset = SlurmClient._read_output_delta(str(path), None, 20)
+        assert (text, offset) == ("progress ██", len(bar))
+        with path.open("ab") as f:
+            f.write(block[1:] + block + b"\n")
+        assert SlurmClient._read_output_delta(str(path), offset, 20) == ("██\n", len(bar) + 2 * len(block) + 1)
+
+    def test_read_truncated_file(self, tmp_path) -> None:
+        """Test that a file that shrank is read again from its tail."""
+        path = tmp_path / "out.txt"
+        path.write_text("x\n")
+        assert SlurmClient._read_output_delta(str(path), 100, 20) == ("x\n", 2)
+
+    def test_read_missing_path(self) -> None:
+        """Test that jobs without an output file return nothing."""
+        assert SlurmClient._read_output_delta("/dev/null", None, 20) == ("", 0)
+
+
+class TestSlurmClientOutputParsing:
+    """Tests for parsing squeue/sinfo output."""
+
+    def test_parse_basic_jobs(self, slurm_client: SlurmClient) -> None:
+        """Test parsing of the '|'-separated squeue fallback format."""
+        cols = ["JOBID", "USER", "STATE", "TIME", "NODES", "PARTITION", "NAME", "NODELIST(REASON)", "CPUS", "MEM"]
+        out = "101|alice|RUNNING|1:00|1|gpu|train|node01|8|16G\n\n"
+        jobs = slurm_client._parse_jobs(out, cols)
+        assert len(jobs) == 1
+        assert jobs[0]["JOBID"] == "101"
+        assert jobs[0]["NAME_SHORT"] == "train"
+        assert jobs[0]["GPU_COUNT"] == ""
+
+    def test_parse_nodes_skips_short_lines(self) -> None:
+        """Test that incomplete sinfo lines are ignored."""
+        cols = ["NODE", "PARTITION", "STATE"]
+        nodes = SlurmClient._parse_nodes("node01|gpu|idle|\nbroken\n", cols)
+        assert nodes == [{"NODE": "node01", "PARTITION": "gpu", "STATE": "idle"}]
+
+
 class TestSlurmClientNodeGpuParsing:
     """Tests for node GPU parsing methods."""
 
@@ -1,8 +1,9 @@
 """Tests for smon.utils module."""
 
+import re
 import sys
 
-from smon.utils import which
+from smon.utils import now_hms, run_cmd, which
 
 
 class TestWhich:
@@ -32,3 +33,26 @@ class TestWhich:
         # Just verify which() works by finding it via the full path
         result = which(sys.executable)
         assert result is not None
+
+
+class TestNowHms:
+    """Tests for the now_hms function."""
+
+    def test_now_hms_format(self) -> None:
+        """Test that the current time is formatted as HH:MM:SS."""
+        assert re.fullmatch(r"\d{2}:\d{2}:\d{2}", now_hms())
+
+
+class TestRunCmd:
+    """Tests for the run_cmd function."""
+
+    async def test_quoted_arguments(self) -> None:
+        """Test that quoted arguments reach the command unsplit."""
+        rc, out, _err = await run_cmd(f"{sys.executable} -c 'import sys; print(sys.argv[1])' 'a b'")
+        assert rc == 0
+        assert out.strip() == "a b"
+
+    async def test_missing_command(self) -> None:
+        """Test that a missing command reports exit status 127."""
+        rc, _out, _err = await run_cmd("nonexistent_command_xyz123 --help")
+        assert rc == 127
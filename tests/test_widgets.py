@@ -1,6 +1,9 @@
 """Tests for smon.widgets module."""
 
-from smon.widgets import Filter
+from rich.console import Console
+from rich.syntax import Syntax
+
+from smon.widgets import CachedSyntax, Filter, LogViewer, StatusBar
 
 
 class TestFilter:
@@ -47,6 +50,18 @@ class TestFilter:
         filtered = filter_instance.apply_jobs(sample_jobs)
         assert len(filtered) == 1
 
+    def test_filter_text_does_not_span_fields(self, filter_instance: Filter, sample_jobs: list[dict]) -> None:
+        """Test that text search does not match across adjacent field values."""
+        filter_instance.text = "12345alice"
+        assert filter_instance.apply_jobs(sample_jobs) == []
+
+    def test_filter_text_refine_same_rows(self, filter_instance: Filter, sample_jobs: list[dict]) -> None:
+        """Test that refining the search over the same rows matches the new text."""
+        filter_instance.text = "a"
+        assert len(filter_instance.apply_jobs(sample_jobs)) > 1
+        filter_instance.text = "train"
+        assert len(filter_instance.apply_jobs(sample_jobs)) == 1
+
     def test_filter_jobs_combined(self, filter_instance: Filter, sample_jobs: list[dict]) -> None:
         """Test combining multiple filters."""
         filter_instance.user = "alice"
@@ -79,3 +94,71 @@ class TestFilter:
         filter_instance.user = "alice"
         filtered = filter_instance.apply_jobs([])
         assert len(filtered) == 0
+
+
+class TestLogViewer:
+    """Tests for the LogViewer widget."""
+
+    def test_set_content_skips_unchanged(self, monkeypatch) -> None:
+        """Test that setting identical content does not re-render."""
+        viewer = LogViewer()
+        updates: list[str] = []
+        monkeypatch.setattr(viewer, "update", updates.append)
+        monkeypatch.setattr(viewer, "scroll_end", lambda: None)
+        viewer.set_content("line 1\n")
+        viewer.set_content("line 1\n")
+        assert updates == ["line 1\n"]
+        viewer.set_content("line 1\nline 2\n")
+        assert len(updates) == 2
+
+    def test_set_content_after_append(self, monkeypatch) -> None:
+        """Test that re-setting the text already built up by appends does not re-render."""
+        viewer = LogViewer()
+        updates: list[str] = []
+        monkeypatch.setattr(viewer, "update", updates.append)
+        monkeypatch.setattr(viewer, "scroll_end", lambda: None)
+        viewer.set_content("line 1\n")
+        viewer.append_content("line 2\n")
+        viewer.set_content("line 1\nline 2\n")
+        assert len(updates) == 2
+
+    def test_long_content_keeps_tail(self, monkeypatch) -> None:
+        """Test that only the last max_lines lines of a long log are shown."""
+        viewer = LogViewer()
+        updates: list[str] = []
+        monkeypatch.setattr(viewer, "update", updates.append)
+        monkeypatch.setattr(viewer, "scroll_end", lambda: None)
+        viewer.set_content("\n".join(str(i) for i in range(1500)))
+        assert updates[-1] == "\n".join(str(i) for i in range(500, 1500))
+        viewer.append_content("\n1500")
+        assert updates[-1] == "\n".join(str(i) for i in range(501, 1501))
+
+
+class TestStatusBar:
+    """Tests for the StatusBar widget."""
+
+    def test_message_not_parsed_as_markup(self, monkeypatch) -> None:
+        """Test that brackets in a message are shown literally."""
+        bar = StatusBar()
+        updates: list = []
+        monkeypatch.setattr(bar, "update", updates.append)
+        bar.watch_message("Error: [Errno 2] No such file")
+        assert updates[0].plain == "Error: [Errno 2] No such file"
+
+
+class TestCachedSyntax:
+    """Tests for the CachedSyntax renderable."""
+
+    def test_lexes_once_and_renders_like_syntax(self, monkeypatch) -> None:
+        """Test that repeated renders reuse the lexed code without changing the output."""
+        code = "#!/bin/bash\n#SBATCH -N 1\nsrun python train.py  # run\n"
+        console = Console(width=60, force_terminal=True)
+        expected = console.render_lines(Syntax(code, "bash", theme="monokai", line_numbers=True))
+
+        calls = []
+        highlight = Syntax.highlight
+        monkeypatch.setattr(Syntax, "highlight", lambda self, *args: calls.append(1) or highlight(self, *args))
+        syntax = CachedSyntax(code, "bash", theme="monokai", line_numbers=True)
+        assert console.render_lines(syntax) == expected
+        assert console.render_lines(syntax) == expected
+        assert len(calls) == 1